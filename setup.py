@@ -61,6 +61,7 @@ setuptools.setup(
         "cirq>=0.9.1,<=0.10",
         "qiskit~=0.25",
         "overrides~=3.1",
+        "python-rapidjson~=1.0",
     ],
     extras_require=extras_require,
 )
@@ -1,9 +1,10 @@
 import json
-import random
-from random import uniform
-from typing import Optional, cast, Dict
+import operator
+from typing import Callable, Dict, Optional, cast
 
 import networkx as nx
+import numpy as np
+import rapidjson
 from zquantum.core.typing import AnyPath, LoadSource
 
 from .utils import SCHEMA_VERSION
@@ -35,25 +36,59 @@ def load_graph(file: LoadSource) -> nx.Graph:
 
     if isinstance(file, str):
         with open(file, "r") as f:
-            data = json.load(f)
+            data = rapidjson.load(f)
     else:
-        data = json.load(file)
+        data = rapidjson.load(file)
 
-    return nx.readwrite.json_graph.node_link_graph(data)
+    return _graph_from_node_link_data(data)
+
+
+def _as_node(node_id):
+    return tuple(node_id) if isinstance(node_id, list) else node_id
+
+
+def _graph_from_node_link_data(data: dict) -> nx.Graph:
+    """Build graph from data in node-link format.
+
+    This is equivalent to networkx's node_link_graph, except that nodes and edges
+    of simple graphs are added in bulk instead of one by one.
+    """
+    if data.get("multigraph", False):
+        return nx.readwrite.json_graph.node_link_graph(data)
+
+    graph = nx.DiGraph() if data.get("directed", False) else nx.Graph()
+    graph.graph = data.get("graph", {})
+    graph.add_nodes_from(
+        (
+            _as_node(node_data["id"]),
+            {key: value for key, value in node_data.items() if key != "id"},
+        )
+        for node_data in data["nodes"]
+    )
+    graph.add_edges_from(
+        (
+            _as_node(link_data["source"]),
+            _as_node(link_data["target"]),
+            {
+                key: value
+                for key, value in link_data.items()
+                if key != "source" and key != "target"
+            },
+        )
+        for link_data in data["links"]
+    )
+    return graph
 
 
 def compare_graphs(graph1: nx.Graph, graph2: nx.Graph) -> bool:
     """Compares two NetworkX graph objects to see if they are identical.
     NOTE: this is *not* solving isomorphism problem.
     """
-
-    for n1, n2 in zip(graph1.nodes, graph2.nodes):
-        if n1 != n2:
-            return False
-    for e1, e2 in zip(graph1.edges, graph2.edges):
-        if e1 != e2:
-            return False
-    return True
+    # map and all drive the iteration and stop at the first mismatch in C, but
+    # __eq__ is still called for every pair of nodes and edges.
+    return all(map(operator.eq, graph1.nodes, graph2.nodes)) and all(
+        map(operator.eq, graph1.edges, graph2.edges)
+    )
 
 
 def generate_graph_node_dict(graph: nx.Graph) -> dict:
@@ -96,7 +131,14 @@ def generate_random_graph_erdos_renyi(
     Returns:
         A networkx.Graph object
     """
-    output_graph = nx.erdos_renyi_graph(n=num_nodes, p=probability, seed=seed)
+    # Coins for all the n(n-1)/2 possible edges are tossed in a single numpy call.
+    sources, targets = np.triu_indices(num_nodes, k=1)
+    is_edge = np.random.default_rng(seed).random(len(sources)) < probability
+
+    output_graph = nx.empty_graph(num_nodes)
+    output_graph.add_edges_from(
+        zip(sources[is_edge].tolist(), targets[is_edge].tolist())
+    )
     output_graph = weight_graph_edges(output_graph, random_weights, seed)
 
     return output_graph
@@ -173,17 +215,40 @@ def weight_graph_edges(
     """
     assert not graph.is_multigraph(), "Cannot deal with multigraphs"
 
-    random.seed(seed)
     if random_weights:
-        weighted_edges = [(e[0], e[1], uniform(0, 1)) for e in graph.edges]
+        weights = np.random.default_rng(seed).uniform(size=graph.number_of_edges())
     else:
-        weighted_edges = [(e[0], e[1], 1.0) for e in graph.edges]
+        weights = np.ones(graph.number_of_edges())
 
-    # If edges already present, it will effectively update them (except for multigraph)
-    graph.add_weighted_edges_from(weighted_edges)
+    nx.set_edge_attributes(graph, dict(zip(graph.edges, weights.tolist())), "weight")
     return graph
 
 
+# Graph generators keyed by the "type_graph" entry of graph specs. Each of them
+# takes the specs dictionary and the keyword arguments shared by all generators
+# (random_weights and seed).
+_GRAPH_GENERATORS_BY_TYPE: Dict[str, Callable[..., nx.Graph]] = {
+    "erdos_renyi": lambda specs, **kwargs: generate_random_graph_erdos_renyi(
+        specs.get("num_nodes"), specs["probability"], **kwargs
+    ),
+    "regular": lambda specs, **kwargs: generate_random_regular_graph(
+        specs.get("num_nodes"), specs["degree"], **kwargs
+    ),
+    "complete": lambda specs, **kwargs: generate_random_graph_erdos_renyi(
+        specs.get("num_nodes"), 1.0, **kwargs
+    ),
+    "caveman": lambda specs, **kwargs: generate_caveman_graph(
+        specs.get("number_of_cliques"), specs.get("size_of_cliques"), **kwargs
+    ),
+    "ladder": lambda specs, **kwargs: generate_ladder_graph(
+        specs.get("length_of_ladder"), **kwargs
+    ),
+    "barbell": lambda specs, **kwargs: generate_barbell_graph(
+        specs.get("number_of_vertices_complete_graph"), **kwargs
+    ),
+}
+
+
 def generate_graph_from_specs(graph_specs: dict) -> nx.Graph:
     """Generate a graph from a specs dictionary
 
@@ -196,42 +261,11 @@ def generate_graph_from_specs(graph_specs: dict) -> nx.Graph:
         A networkx.Graph object
     """
     type_graph = cast(str, graph_specs["type_graph"])
-    num_nodes = cast(int, graph_specs.get("num_nodes"))
-    random_weights = graph_specs.get("random_weights", False)
-    seed = graph_specs.get("seed")
-    number_of_cliques = cast(int, graph_specs.get("number_of_cliques"))
-    size_of_cliques = cast(int, graph_specs.get("size_of_cliques"))
-    length_of_ladder = cast(int, graph_specs.get("length_of_ladder"))
-    number_of_vertices_complete_graph = cast(
-        int, graph_specs.get("number_of_vertices_complete_graph")
-    )
-
-    if type_graph == "erdos_renyi":
-        probability = graph_specs["probability"]
-        graph = generate_random_graph_erdos_renyi(
-            num_nodes, probability, random_weights, seed
-        )
-
-    elif type_graph == "regular":
-        degree = graph_specs["degree"]
-        graph = generate_random_regular_graph(num_nodes, degree, random_weights, seed)
-
-    elif type_graph == "complete":
-        graph = generate_random_graph_erdos_renyi(num_nodes, 1.0, random_weights, seed)
-
-    elif type_graph == "caveman":
-        graph = generate_caveman_graph(
-            number_of_cliques, size_of_cliques, random_weights, seed
-        )
-
-    elif type_graph == "ladder":
-        graph = generate_ladder_graph(length_of_ladder, random_weights, seed)
-
-    elif type_graph == "barbell":
-        graph = generate_barbell_graph(
-            number_of_vertices_complete_graph, random_weights, seed
-        )
-    else:
+    if type_graph not in _GRAPH_GENERATORS_BY_TYPE:
         raise (NotImplementedError("This type of graph is not supported: ", type_graph))
 
-    return graph
+    return _GRAPH_GENERATORS_BY_TYPE[type_graph](
+        graph_specs,
+        random_weights=graph_specs.get("random_weights", False),
+        seed=graph_specs.get("seed"),
+    )
@@ -1,6 +1,6 @@
 import warnings
 from abc import ABC, abstractmethod
-from typing import List, Optional, Sequence, Any
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 from openfermion import IsingOperator, SymbolicOperator
@@ -13,7 +13,11 @@ from ..bitstring_distribution import (
 )
 from ..circuit import CircuitConnectivity
 from ..measurement import ExpectationValues, Measurements, expectation_values_to_real
-from ..openfermion import change_operator_type, get_expectation_value
+from ..openfermion import (
+    change_operator_type,
+    get_expectation_values_of_terms,
+    get_sparse_operators_of_terms,
+)
 from ..wip.circuits._compatibility import AnyCircuit
 
 
@@ -28,6 +32,11 @@ class QuantumBackend(ABC):
 
     supports_batching = False
     batch_size = None
+    # Backends that do not keep any state between runs can declare themselves
+    # stateless, so that a single instance is reused by `create_backend`. Note
+    # that the counters of run circuits and jobs below are such state, so
+    # instances sharing them should not declare it.
+    is_stateless = False
 
     def __init__(self, n_samples: Optional[int] = None):
         if n_samples is not None:
@@ -243,6 +252,11 @@ class QuantumSimulator(QuantumBackend):
         Returns:
             Expectation values for given operator.
         """
+        if self.n_samples is None:
+            # Exact expectation values of all circuits are computed from the same
+            # sparse matrices of the operator's terms, built only once.
+            kwargs = {**kwargs, "sparse_operators_cache": {}}
+
         if not self.supports_batching:
             expectation_values_set = []
             for circuit in circuits:
@@ -272,7 +286,11 @@ class QuantumSimulator(QuantumBackend):
                 return expectation_values_set
 
     def get_exact_expectation_values(
-        self, circuit: AnyCircuit, operator: SymbolicOperator, **kwargs
+        self,
+        circuit: AnyCircuit,
+        operator: SymbolicOperator,
+        sparse_operators_cache: Optional[Dict[int, List[Any]]] = None,
+        **kwargs
     ) -> ExpectationValues:
         """Calculates the expectation values for given operator, based on the exact
         quantum state produced by circuit.
@@ -280,13 +298,28 @@ class QuantumSimulator(QuantumBackend):
         Args:
             circuit: quantum circuit to be executed.
             operator: Operator for which we calculate the expectation value.
+            sparse_operators_cache: Sparse matrices of the operator's terms, keyed
+                by the number of qubits they act on. Matrices missing for the
+                number of qubits of the circuit's wavefunction are built and added
+                to it, so that passing the same dict while evaluating the operator
+                for many circuits builds them only once.
 
         Returns:
             Expectation values for given operator.
         """
         wavefunction = self.get_wavefunction(circuit)
+        sparse_operators = None
+        if sparse_operators_cache is not None:
+            n_qubits = wavefunction.amplitudes.shape[0].bit_length() - 1
+            if n_qubits not in sparse_operators_cache:
+                sparse_operators_cache[n_qubits] = get_sparse_operators_of_terms(
+                    operator, n_qubits
+                )
+            sparse_operators = sparse_operators_cache[n_qubits]
         expectation_values = ExpectationValues(
-            np.array([get_expectation_value(term, wavefunction) for term in operator])
+            get_expectation_values_of_terms(
+                operator, wavefunction, sparse_operators=sparse_operators
+            )
         )
         expectation_values = expectation_values_to_real(expectation_values)
         return expectation_values
@@ -17,6 +17,7 @@ from typing import (
 )
 
 import numpy as np
+import rapidjson
 from openfermion.ops import IsingOperator
 from pyquil.wavefunction import Wavefunction
 from zquantum.core.typing import AnyPath, LoadSource
@@ -44,7 +45,7 @@ def save_expectation_values(
     dictionary["schema"] = SCHEMA_VERSION + "-expectation_values"
 
     with open(filename, "w") as f:
-        f.write(json.dumps(dictionary, indent=2))
+        rapidjson.dump(dictionary, f, indent=2)
 
 
 def load_expectation_values(file: LoadSource) -> ExpectationValues:
@@ -86,18 +87,26 @@ def load_wavefunction(file: LoadSource) -> Wavefunction:
     return wavefunction
 
 
-def save_wavefunction(wavefunction: Wavefunction, filename: AnyPath) -> None:
+def save_wavefunction(
+    wavefunction: Union[Wavefunction, np.ndarray], filename: AnyPath
+) -> None:
     """Save a wavefunction object to a file.
 
     Args:
-        wavefunction (pyquil.wavefunction.Wavefunction): the wavefunction object
+        wavefunction (pyquil.wavefunction.Wavefunction or numpy.ndarray): the
+            wavefunction object, or the array of its amplitudes
         filename (str): the name of the file
     """
+    amplitudes = (
+        wavefunction
+        if isinstance(wavefunction, np.ndarray)
+        else wavefunction.amplitudes
+    )
 
     data: Dict[str, Any] = {"schema": SCHEMA_VERSION + "-wavefunction"}
-    data["amplitudes"] = convert_array_to_dict(wavefunction.amplitudes)
+    data["amplitudes"] = convert_array_to_dict(amplitudes)
     with open(filename, "w") as f:
-        f.write(json.dumps(data, indent=2))
+        rapidjson.dump(data, f, indent=2)
 
 
 class ExpectationValues:
@@ -12,7 +12,12 @@ from openfermion import (
 from zquantum.core.typing import LoadSource
 
 from ..typing import AnyPath
-from ..utils import SCHEMA_VERSION, convert_array_to_dict, convert_dict_to_array
+from ..utils import (
+    SCHEMA_VERSION,
+    ValueEstimate,
+    convert_array_to_dict,
+    convert_dict_to_array,
+)
 
 
 def convert_interaction_op_to_dict(op: InteractionOperator) -> Dict[str, Any]:
@@ -303,6 +308,77 @@ def save_parameter_grid_evaluation(parameter_grid_evaluation, filename):
         f.write(json.dumps(full_dict, indent=2))
 
 
+def save_parameter_grid_result(
+    parameter_grid_evaluation, optimal_parameters, filename: AnyPath
+) -> None:
+    """Save a list of parameter grid evaluations together with the optimal
+    parameters to a single uncompressed .npz file
+
+    Args:
+        parameter_grid_evaluation (list): List of dicts with a value estimate object
+            under the "value" field and the grid point under the "parameter1" and
+            "parameter2" fields
+        optimal_parameters (numpy array): the optimal parameters
+        filename (str or file-like object): the name of the file, or a file-like
+            object
+    """
+    values = [evaluation["value"] for evaluation in parameter_grid_evaluation]
+    np.savez(
+        filename,
+        values=np.array([value.value for value in values], dtype=float),
+        precisions=np.array(
+            [
+                np.nan if value.precision is None else value.precision
+                for value in values
+            ],
+            dtype=float,
+        ),
+        parameter1=np.array(
+            [evaluation["parameter1"] for evaluation in parameter_grid_evaluation],
+            dtype=float,
+        ),
+        parameter2=np.array(
+            [evaluation["parameter2"] for evaluation in parameter_grid_evaluation],
+            dtype=float,
+        ),
+        optimal_parameters=np.asarray(optimal_parameters, dtype=float),
+    )
+
+
+def load_parameter_grid_result(file: LoadSource):
+    """Load a list of parameter grid evaluations and the optimal parameters saved
+    with `save_parameter_grid_result`
+
+    Args:
+        file (str or file-like object): the name of the file, or a file-like object
+
+    Returns:
+        parameter_grid_evaluation (list): List of dicts with a value estimate object
+            under the "value" field and the grid point under the "parameter1" and
+            "parameter2" fields
+        optimal_parameters (numpy array): the optimal parameters
+    """
+    with np.load(file) as data:
+        parameter_grid_evaluation = [
+            {
+                "value": ValueEstimate(
+                    value, None if np.isnan(precision) else precision
+                ),
+                "parameter1": parameter1,
+                "parameter2": parameter2,
+            }
+            for value, precision, parameter1, parameter2 in zip(
+                data["values"].tolist(),
+                data["precisions"].tolist(),
+                data["parameter1"].tolist(),
+                data["parameter2"].tolist(),
+            )
+        ]
+        optimal_parameters = data["optimal_parameters"]
+
+    return parameter_grid_evaluation, optimal_parameters
+
+
 def convert_interaction_rdm_to_dict(op):
     """Convert an InteractionRDM to a dictionary.
     Args:
@@ -1,9 +1,13 @@
 import itertools
 import random
-from typing import List, Optional, Union, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union, Iterable
 
 import cirq
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 from openfermion import (
     FermionOperator,
     InteractionOperator,
@@ -24,7 +28,7 @@ from openfermion.transforms import freeze_orbitals, get_fermion_operator
 
 from ..circuit import Circuit, Gate, Qubit
 from ..measurement import ExpectationValues, expectation_values_to_real
-from ..utils import ValueEstimate, bin2dec, dec2bin
+from ..utils import RNDSEED, ValueEstimate, bin2dec, dec2bin
 
 
 def get_qubitop_from_matrix(operator: List[List]) -> QubitOperator:
@@ -266,8 +270,59 @@ def evaluate_qubit_operator_list(
     return value_estimate
 
 
+def _get_expectation_values_for_circuitset_chunk(backend, circuits, operator, seed):
+    # Workers forked from the same process start with identical states of the
+    # global random generators, hence they are seeded independently.
+    random.seed(seed)
+    np.random.seed(seed)
+    number_of_circuits_run = backend.number_of_circuits_run
+    number_of_jobs_run = backend.number_of_jobs_run
+    expectation_values_set = backend.get_expectation_values_for_circuitset(
+        circuits, operator
+    )
+    return (
+        expectation_values_set,
+        backend.number_of_circuits_run - number_of_circuits_run,
+        backend.number_of_jobs_run - number_of_jobs_run,
+    )
+
+
+def _get_expectation_values_for_circuitset_in_parallel(
+    backend, circuitset, operator, num_workers
+):
+    # Ceiling division, so that there are at most num_workers chunks.
+    chunk_size = -(-len(circuitset) // num_workers)
+    chunks = [
+        circuitset[start : start + chunk_size]
+        for start in range(0, len(circuitset), chunk_size)
+    ]
+    seeds = [
+        int(seed_sequence.generate_state(1)[0])
+        for seed_sequence in np.random.SeedSequence().spawn(len(chunks))
+    ]
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        chunks_results = list(
+            executor.map(
+                _get_expectation_values_for_circuitset_chunk,
+                itertools.repeat(backend, len(chunks)),
+                chunks,
+                itertools.repeat(operator, len(chunks)),
+                seeds,
+            )
+        )
+
+    # Workers run copies of the backend, so circuits and jobs they ran are
+    # accounted for in the original one.
+    expectation_values_set = []
+    for chunk_expectation_values, circuits_run, jobs_run in chunks_results:
+        expectation_values_set.extend(chunk_expectation_values)
+        backend.number_of_circuits_run += circuits_run
+        backend.number_of_jobs_run += jobs_run
+    return expectation_values_set
+
+
 def evaluate_operator_for_parameter_grid(
-    ansatz, grid, backend, operator, previous_layer_params=[]
+    ansatz, grid, backend, operator, previous_layer_params=[], num_workers=1
 ):
     """Evaluate the expectation value of an operator for every set of circuit
     parameters in the parameter grid.
@@ -280,7 +335,17 @@ def evaluate_operator_for_parameter_grid(
             to run the circuits on
         operator (openfermion.ops.QubitOperator): the operator
         previous_layer_params (array): A list of the parameters for previous layers
-            of the ansatz
+            of the ansatz. It is converted to a 1-D float64 array, which is not
+            copied if it is one already.
+        num_workers (int): number of processes evaluating the grid points. If
+            greater than 1, the grid is split into that many chunks, each of them
+            evaluated by a copy of the backend in a separate process (hence the
+            backend and the operator have to be picklable). Circuits and jobs run
+            by the copies are added to the backend's counters, and the global
+            random generators of the workers are seeded independently (random
+            generators stored in the backend itself are copied as they are).
+            Use it only with simulators, as the number of jobs will be
+            multiplied.
 
     Returns:
         value_estimate (zquantum.core.utils.ValueEstimate): stores the value of the
@@ -290,41 +355,49 @@ def evaluate_operator_for_parameter_grid(
             parameters evaluate to the same value, the first set of parameters is chosen
             as the optimal.
     """
-    parameter_grid_evaluation = []
-    circuitset = []
-    params_set = []
-    for last_layer_params in grid.params_list:
-        # Build the ansatz circuit
-        params = np.concatenate(
-            (np.asarray(previous_layer_params), np.asarray(last_layer_params))
+    # Parameters for all points of the grid are assembled into a single
+    # (number of points) x (number of parameters) array.
+    last_layer_params_set = np.asarray(grid.params_list)
+    previous_layer_params = np.asarray(previous_layer_params, dtype=np.float64)
+    params_set = np.hstack(
+        (
+            np.broadcast_to(
+                previous_layer_params,
+                (len(last_layer_params_set), len(previous_layer_params)),
+            ),
+            last_layer_params_set,
         )
-
-        # Build the ansatz circuit
-        circuitset.append(ansatz.get_executable_circuit(params))
-        params_set.append(params)
-
-    expectation_values_set = backend.get_expectation_values_for_circuitset(
-        circuitset, operator
     )
 
-    min_value_estimate = None
-    for params, expectation_values in zip(params_set, expectation_values_set):
-        expectation_values = expectation_values_to_real(expectation_values)
-        value_estimate = ValueEstimate(sum(expectation_values.values))
-        parameter_grid_evaluation.append(
-            {
-                "value": value_estimate,
-                "parameter1": params[-2],
-                "parameter2": params[-1],
-            }
+    circuitset = [ansatz.get_executable_circuit(params) for params in params_set]
+    if num_workers > 1 and len(circuitset) > 1:
+        expectation_values_set = _get_expectation_values_for_circuitset_in_parallel(
+            backend, circuitset, operator, num_workers
+        )
+    else:
+        expectation_values_set = backend.get_expectation_values_for_circuitset(
+            circuitset, operator
         )
 
-        if min_value_estimate is None:
-            min_value_estimate = value_estimate
-            optimal_parameters = params
-        elif value_estimate.value < min_value_estimate.value:
-            min_value_estimate = value_estimate
-            optimal_parameters = params
+    parameter_grid_evaluation = [
+        {
+            "value": ValueEstimate(
+                sum(expectation_values_to_real(expectation_values).values)
+            ),
+            "parameter1": params[-2],
+            "parameter2": params[-1],
+        }
+        for params, expectation_values in zip(params_set, expectation_values_set)
+    ]
+
+    # nanargmin picks the first of the parameter sets with the same minimal value,
+    # skipping NaN values. If all values are NaN, the first set is chosen.
+    values = np.array(
+        [evaluation["value"].value for evaluation in parameter_grid_evaluation]
+    )
+    optimal_parameters = params_set[
+        0 if np.all(np.isnan(values)) else np.nanargmin(values)
+    ]
 
     return parameter_grid_evaluation, optimal_parameters
 
@@ -386,6 +459,67 @@ def get_expectation_value(qubit_op, wavefunction, reverse_operator=True):
     return exp_val
 
 
+def get_sparse_operators_of_terms(
+    qubit_op, n_qubits, reverse_operator=True
+) -> List[scipy.sparse.spmatrix]:
+    """Get the sparse matrices of the terms of qubit operator.
+
+    Args:
+        qubit_op (openfermion.ops.SymbolicOperator): the operator
+        n_qubits (int): the number of qubits the matrices act on
+        reverse_operator (boolean): whether to reverse order of qubit operator,
+            see `get_expectation_value`.
+    Returns:
+        list: the sparse matrices of the terms, in the order of iterating over
+            `qubit_op`
+    """
+    return list(
+        _iterate_sparse_operators_of_terms(qubit_op, n_qubits, reverse_operator)
+    )
+
+
+def _iterate_sparse_operators_of_terms(qubit_op, n_qubits, reverse_operator):
+    for term in qubit_op:
+        if reverse_operator:
+            term = reverse_qubit_order(term, n_qubits=n_qubits)
+        yield get_sparse_operator(term, n_qubits=n_qubits)
+
+
+def get_expectation_values_of_terms(
+    qubit_op, wavefunction, reverse_operator=True, sparse_operators=None
+) -> np.ndarray:
+    """Get the expectation values of each term of qubit operator w.r.t. wavefunction.
+
+    This is equivalent to calling `get_expectation_value` for every term of the
+    operator. To evaluate the same operator for many wavefunctions (e.g. for every
+    point of a parameter grid), build the sparse matrices of its terms once with
+    `get_sparse_operators_of_terms` and pass them as `sparse_operators`. Otherwise,
+    the matrices are built one at a time and discarded right after use.
+
+    Args:
+        qubit_op (openfermion.ops.SymbolicOperator): the operator
+        wavefunction (pyquil.wavefunction.Wavefunction): the wavefunction
+        reverse_operator (boolean): whether to reverse order of qubit operator
+            before computing expectation values, see `get_expectation_value`.
+        sparse_operators (list): the sparse matrices of the terms of `qubit_op`,
+            as returned by `get_sparse_operators_of_terms` with the same
+            `reverse_operator`
+    Returns:
+        numpy.ndarray: the expectation values of the terms
+    """
+    if sparse_operators is None:
+        n_qubits = wavefunction.amplitudes.shape[0].bit_length() - 1
+        sparse_operators = _iterate_sparse_operators_of_terms(
+            qubit_op, n_qubits, reverse_operator
+        )
+    return np.array(
+        [
+            openfermion_expectation(sparse_op, wavefunction.amplitudes)
+            for sparse_op in sparse_operators
+        ]
+    )
+
+
 def change_operator_type(operator, operatorType):
     """Take an operator and attempt to cast it to an operator of a different type
 
@@ -656,6 +790,163 @@ def create_circuits_from_qubit_operator(qubit_operator: QubitOperator) -> List[C
     return circuit_set
 
 
+@lru_cache(maxsize=32)
+def _particle_number_sector_indices(
+    n_qubits: int, particle_number: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices of computational basis states with given number of 1s.
+
+    The indices are ordered as in openfermion's jw_number_indices. Returned tuple
+    contains the indices and the permutation sorting them.
+    """
+    indices = np.array(
+        [
+            sum(1 << qubit for qubit in occupied_qubits)
+            for occupied_qubits in itertools.combinations(
+                range(n_qubits), particle_number
+            )
+        ],
+        dtype=np.int64,
+    )
+    sorting_permutation = np.argsort(indices)
+    # The arrays are cached, hence they must not be modified by callers.
+    indices.flags.writeable = False
+    sorting_permutation.flags.writeable = False
+    return indices, sorting_permutation
+
+
+def get_sparse_operator_at_particle_number(
+    qubit_operator: QubitOperator, particle_number: int, n_qubits: Optional[int] = None
+) -> scipy.sparse.csr_matrix:
+    """Get sparse matrix of qubit operator restricted to given particle number.
+
+    The matrix is built directly in the basis of states with `particle_number` qubits
+    in state 1 (ordered as in openfermion's jw_number_indices), without constructing
+    the matrix on the whole 2^n dimensional space first. Terms taking states out of
+    the subspace are projected out.
+
+    Args:
+        qubit_operator: the operator
+        particle_number: number of particles (qubits in state 1)
+        n_qubits: number of qubits, if None it is inferred from the operator
+
+    Returns:
+        CSR matrix of shape (d, d), where d is the dimension of the subspace.
+    """
+    if n_qubits is None:
+        n_qubits = count_qubits(qubit_operator)
+    if not 0 <= particle_number <= n_qubits:
+        raise ValueError(
+            f"Particle number {particle_number} is invalid for {n_qubits} qubits."
+        )
+
+    basis, sorting_permutation = _particle_number_sector_indices(
+        n_qubits, particle_number
+    )
+    sorted_basis = basis[sorting_permutation]
+    columns = np.arange(len(basis))
+    rows_list, columns_list, data_list = [], [], []
+
+    for term, coefficient in qubit_operator.terms.items():
+        flip_mask = 0
+        values = np.full(len(basis), coefficient, dtype=complex)
+        for qubit, pauli in term:
+            bit_position = n_qubits - 1 - qubit
+            signs = 1 - 2 * ((basis >> bit_position) & 1)
+            if pauli == "X":
+                flip_mask |= 1 << bit_position
+            elif pauli == "Y":
+                flip_mask |= 1 << bit_position
+                values *= 1j * signs
+            else:
+                values *= signs
+
+        targets = basis ^ flip_mask
+        positions = np.searchsorted(sorted_basis, targets)
+        in_sector = positions < len(basis)
+        in_sector[in_sector] = sorted_basis[positions[in_sector]] == targets[in_sector]
+
+        rows_list.append(sorting_permutation[positions[in_sector]])
+        columns_list.append(columns[in_sector])
+        data_list.append(values[in_sector])
+
+    # Duplicate entries, coming from different terms, are summed up.
+    return scipy.sparse.csr_matrix(
+        (
+            np.concatenate(data_list or [np.zeros(0, dtype=complex)]),
+            (
+                np.concatenate(rows_list or [np.zeros(0, dtype=int)]),
+                np.concatenate(columns_list or [np.zeros(0, dtype=int)]),
+            ),
+        ),
+        shape=(len(basis), len(basis)),
+    )
+
+
+# Ground states found by get_ground_state_at_particle_number for each
+# (n_qubits, particle_number) sector. They are used as starting vectors of
+# subsequent diagonalizations in the same sector.
+_LAST_GROUND_STATES: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def _initial_lanczos_vector(n_qubits: int, particle_number: int, dimension: int):
+    previous_ground_state = _LAST_GROUND_STATES.get((n_qubits, particle_number))
+    if previous_ground_state is None or len(previous_ground_state) != dimension:
+        return None
+    # Small random component makes sure the starting vector is not orthogonal to
+    # the new ground state, e.g. because of a symmetry of the previous operator.
+    noise = np.random.default_rng(RNDSEED).uniform(-1, 1, dimension)
+    return previous_ground_state + 1e-3 * noise / np.linalg.norm(noise)
+
+
+def get_ground_state_at_particle_number(
+    qubit_operator: QubitOperator, particle_number: int, n_qubits: Optional[int] = None
+) -> Tuple[float, np.ndarray]:
+    """Get the ground state energy and wavefunction of operator at particle number.
+
+    This is equivalent to openfermion's jw_get_ground_state_at_particle_number, but
+    the operator is constructed and diagonalized only in the subspace with given
+    particle number, which is much smaller than the whole 2^n dimensional space.
+
+    Since this is typically called repeatedly for slightly different operators (e.g.
+    in outer optimization loops), the Lanczos iteration is started from the ground
+    state found by the previous call for the same number of qubits and particles,
+    which reduces the number of iterations needed to converge.
+
+    Args:
+        qubit_operator: the operator
+        particle_number: number of particles in the ground state
+        n_qubits: number of qubits, if None it is inferred from the operator
+
+    Returns:
+        Tuple of ground state energy and ground state amplitudes (of length 2^n).
+    """
+    if n_qubits is None:
+        n_qubits = count_qubits(qubit_operator)
+    restricted_operator = get_sparse_operator_at_particle_number(
+        qubit_operator, particle_number, n_qubits
+    )
+
+    if restricted_operator.shape[0] - 1 <= 1:
+        # Restricted operator too small for sparse eigensolver
+        eigenvalues, eigenvectors = np.linalg.eigh(restricted_operator.toarray())
+    else:
+        eigenvalues, eigenvectors = scipy.sparse.linalg.eigsh(
+            restricted_operator,
+            k=1,
+            which="SA",
+            v0=_initial_lanczos_vector(
+                n_qubits, particle_number, restricted_operator.shape[0]
+            ),
+        )
+    _LAST_GROUND_STATES[n_qubits, particle_number] = eigenvectors[:, 0]
+
+    sector_indices, _ = _particle_number_sector_indices(n_qubits, particle_number)
+    state = np.zeros(2 ** n_qubits, dtype=complex)
+    state[sector_indices] = eigenvectors[:, 0]
+    return eigenvalues[0], state
+
+
 def get_ground_state_rdm_from_qubit_op(
     qubit_operator: QubitOperator, n_particles: int
 ) -> InteractionRDM:
@@ -669,9 +960,8 @@ def get_ground_state_rdm_from_qubit_op(
         rdm: interaction RDM of the ground state with the particle number n_particles
     """
 
-    sparse_operator = get_sparse_operator(qubit_operator)
-    e, ground_state_wf = jw_get_ground_state_at_particle_number(
-        sparse_operator, n_particles
+    e, ground_state_wf = get_ground_state_at_particle_number(
+        qubit_operator, n_particles
     )  # float/np.array pair
     n_qubits = count_qubits(qubit_operator)
 
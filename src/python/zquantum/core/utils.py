@@ -8,6 +8,7 @@ import sys
 import warnings
 import inspect
 import numpy as np
+import rapidjson
 from functools import partial
 import sympy
 import lea
@@ -49,8 +50,11 @@ def convert_array_to_dict(array: np.ndarray) -> dict:
 
     dictionary = {}
     if np.iscomplexobj(array):
-        dictionary["real"] = array.real.tolist()
-        dictionary["imag"] = array.imag.tolist()
+        # View complex entries as (real, imag) pairs of floats and move the pair
+        # axis to the front, so that both parts are converted by a single tolist().
+        pairs = np.ascontiguousarray(array).view(array.real.dtype)
+        pairs = pairs.reshape(*array.shape, 2)
+        dictionary["real"], dictionary["imag"] = np.moveaxis(pairs, -1, 0).tolist()
     else:
         dictionary["real"] = array.tolist()
 
@@ -345,7 +349,7 @@ def save_value_estimate(value_estimate: ValueEstimate, filename: AnyPath):
     dictionary["schema"] = SCHEMA_VERSION + "-value_estimate"
 
     with open(filename, "w") as f:
-        f.write(json.dumps(dictionary, indent=2))
+        rapidjson.dump(dictionary, f, indent=2)
 
 
 def load_list(file: LoadSource) -> List:
@@ -455,6 +459,47 @@ def create_object(specs: Dict, **kwargs):
         return creator(**specs, **kwargs)
 
 
+# Maximum number of backends kept by `create_backend`.
+_BACKENDS_CACHE_SIZE = 8
+_CACHED_BACKENDS: Dict[str, Any] = {}
+
+
+def create_backend(specs: Dict):
+    """Creates a backend based on given specs, reusing previously created ones.
+
+    Backends declaring `is_stateless = True` are cached by their specs, so that
+    subsequent calls with the same specs return the same instance instead of
+    initializing the backend again. Other backends and backends whose specs are
+    not JSON serializable are created anew on every call.
+
+    Note that no backend in this package declares itself stateless: every
+    QuantumBackend counts the circuits and jobs it runs, and those counters
+    would be shared by all users of a cached instance.
+
+    Args:
+        specs (dict): specs of the backend, as accepted by `create_object`.
+
+    Returns:
+        object: the backend
+    """
+    try:
+        key = json.dumps(specs, sort_keys=True)
+    except TypeError:
+        return create_object(specs)
+
+    # The flag is checked again for cached backends, since it can be changed
+    # after they were created.
+    backend = _CACHED_BACKENDS.pop(key, None)
+    if backend is None or not getattr(backend, "is_stateless", False):
+        backend = create_object(specs)
+        if not getattr(backend, "is_stateless", False):
+            return backend
+        if len(_CACHED_BACKENDS) >= _BACKENDS_CACHE_SIZE:
+            del _CACHED_BACKENDS[next(iter(_CACHED_BACKENDS))]
+    _CACHED_BACKENDS[key] = backend
+    return backend
+
+
 def load_noise_model(file: LoadSource):
     """Load a noise model from file
 
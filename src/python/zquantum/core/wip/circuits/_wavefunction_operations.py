@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from numbers import Number
 
 from ._gates import _sub_symbols, Parameter
-from typing import Tuple, Sequence
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Sequence, Union
 import numpy as np
 
+# Maximum number of distinct symbol maps for which MultiPhaseOperation.bind
+# results are remembered (per operation). Bound operations hold 2^N params, and
+# in parameter sweeps every symbols map is new, hence only the last one is kept.
+_BIND_CACHE_SIZE = 1
+
 
 @dataclass(frozen=True)
 class MultiPhaseOperation:
@@ -13,20 +18,58 @@ class MultiPhaseOperation:
     MultiPhaseOperation with parameters theta_1, theta_2, .... theta_2^N,
     transforms a N qubit wavefunction (psi_1, psi_2, ..., psi_2^N)
     into (exp(i theta_1)psi_1, exp(i theta_2) psi_2, ..., exp(i theta_2^N) psi_2^N).
+
+    If all parameters are numbers, they are additionally kept as a contiguous
+    float array, so that applying the operation does not need to convert them.
     """
 
     params: Tuple[Parameter, ...]
+    # Derived from params in __post_init__.
+    _qubit_indices: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _numeric_params: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    _bind_cache: Dict[FrozenSet[Any], "MultiPhaseOperation"] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        if any(isinstance(param, Number) and param.imag != 0 for param in self.params):
+        params = np.asarray(self.params)
+        if params.dtype == object:
+            # Symbolic parameters are present, each one has to be inspected separately.
+            has_complex_params = any(
+                isinstance(param, Number) and param.imag != 0 for param in self.params
+            )
+            numeric_params = None
+        else:
+            has_complex_params = np.iscomplexobj(params) and np.any(params.imag != 0)
+            numeric_params = np.ascontiguousarray(params.real, dtype=float)
+
+        if has_complex_params:
             raise ValueError("MultiPhaseOperation supports only real parameters.")
+        object.__setattr__(self, "_numeric_params", numeric_params)
+
+        n_qubits = len(self.params).bit_length() - 1
+        object.__setattr__(self, "_qubit_indices", tuple(range(n_qubits)))
+        object.__setattr__(self, "_bind_cache", {})
 
     @property
     def qubit_indices(self) -> Tuple[int, ...]:
-        n_qubits = int(np.log2(len(self.params)))
-        return tuple(range(n_qubits))
+        return self._qubit_indices
 
     def bind(self, symbols_map) -> "MultiPhaseOperation":
+        try:
+            key = frozenset(symbols_map.items())
+        except TypeError:
+            # Unhashable values in symbols_map, the result can't be cached.
+            return self._bind(symbols_map)
+
+        bound = self._bind_cache.get(key)
+        if bound is None:
+            if len(self._bind_cache) >= _BIND_CACHE_SIZE:
+                del self._bind_cache[next(iter(self._bind_cache))]
+            bound = self._bind_cache[key] = self._bind(symbols_map)
+        return bound
+
+    def _bind(self, symbols_map) -> "MultiPhaseOperation":
         return self.replace_params(
             tuple(_sub_symbols(param, symbols_map) for param in self.params)
         )
@@ -36,18 +79,29 @@ class MultiPhaseOperation:
     ) -> "MultiPhaseOperation":
         return MultiPhaseOperation(new_params)
 
-    def apply(self, wavefunction: Sequence[Parameter]) -> Sequence[Parameter]:
+    def apply(self, wavefunction: Union[np.ndarray, Sequence[complex]]) -> np.ndarray:
         if len(wavefunction) != len(self.params):
             raise ValueError(
                 f"MultiPhaseOperation with {len(self.params)} params cannot be "
                 f"applied to wavefunction of length {len(wavefunction)}."
             )
 
-        try:
-            exp_params = np.exp(np.asarray(self.params, dtype=float) * 1j)
-        except TypeError as e:
-            raise RuntimeError(
-                "MultiPhaseOperation can only be applied only if all symbolic "
-                "parameters are bound to real numbers."
-            ) from e
-        return np.multiply(np.asarray(wavefunction), exp_params)
+        params = self._numeric_params
+        if params is None:
+            try:
+                params = np.asarray(self.params, dtype=float)
+            except TypeError as e:
+                raise RuntimeError(
+                    "MultiPhaseOperation can only be applied only if all symbolic "
+                    "parameters are bound to real numbers."
+                ) from e
+
+        # exp(i * theta) is assembled from cos and sin written directly into
+        # the output buffer, which is then scaled in place. This avoids allocating
+        # temporary arrays of the wavefunction's size.
+        result = np.empty(len(params), dtype=np.complex128)
+        np.cos(params, out=result.real)
+        np.sin(params, out=result.imag)
+        if not isinstance(wavefunction, np.ndarray):
+            wavefunction = np.asarray(wavefunction, dtype=np.complex128)
+        return np.multiply(result, wavefunction, out=result)
@@ -1,21 +1,77 @@
 """Utilities for converting symbolic expressions between different dialects."""
 
-from numbers import Number
-from typing import NamedTuple, Any, Iterable, Dict, Callable
+import operator
+import sys
+from dataclasses import dataclass
 from functools import reduce
+from numbers import Number
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+from weakref import WeakValueDictionary
+
+
+# Symbols and function calls are created in large numbers, hence they define
+# __slots__ instead of having per-instance __dict__. The __weakref__ slot is needed
+# by the interning tables below. Equality checks identity first, which is all that
+# is needed for interned nodes, and only then compares the nodes structurally.
+# Names are interned strings, so that comparing equal names is a pointer
+# comparison, and hashes of function calls are computed once and stored in _hash.
 
 
-class Symbol(NamedTuple):
+@dataclass(frozen=True)
+class Symbol:
     """Abstract symbol."""
 
+    __slots__ = ("name", "__weakref__")
+
     name: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.name == other.name
+
+    def __reduce__(self):
+        return self.__class__, (self.name,)
+
 
-class FunctionCall(NamedTuple):
+@dataclass(frozen=True)
+class FunctionCall:
     """Represents abstract function call.     """
 
+    __slots__ = ("name", "args", "_hash", "__weakref__")
+
     name: str
-    args: Iterable["Expression"]
+    args: Tuple["Expression", ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        # Args passed as other iterables (e.g. lists) are stored as tuples, so that
+        # function calls are always hashable.
+        if type(self.args) is not tuple:
+            object.__setattr__(self, "args", tuple(self.args))
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.name == other.name and self.args == other.args
+
+    def __hash__(self):
+        # Computed lazily, as most function calls are never hashed.
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, "_hash", hash((self.name, self.args)))
+            return self._hash
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.args)
 
 
 # Note that mypy does not support recursive types, so for now Expression is set
@@ -24,6 +80,225 @@ Expression = Any
 # Expression = Union[Symbol, FunctionCall, Number]
 
 
+# Canonical instances of symbols and function calls, see `intern_symbol` and
+# `intern_function_call`. Entries are dropped once the canonical instance is no
+# longer referenced anywhere else.
+_INTERNED_SYMBOLS: "WeakValueDictionary[str, Symbol]" = WeakValueDictionary()
+_INTERNED_FUNCTION_CALLS: "WeakValueDictionary[Any, FunctionCall]" = (
+    WeakValueDictionary()
+)
+
+
+def _interning_key(arg: Expression):
+    # Numbers are keyed by their type too, so that e.g. 2 and 2.0 are not merged.
+    # Floats (and parts of complex numbers) are keyed by their exact hex
+    # representation, so that e.g. 0.0 and -0.0 are not merged either.
+    # Other arguments are keyed by identity: they are alive as long as the
+    # function call that holds them, and hence so is the entry keyed by their id.
+    if isinstance(arg, float):
+        return type(arg), arg.hex()
+    elif isinstance(arg, complex):
+        return type(arg), arg.real.hex(), arg.imag.hex()
+    elif isinstance(arg, Number):
+        return type(arg), arg
+    return id(arg)
+
+
+def intern_symbol(name: str) -> Symbol:
+    """Return canonical Symbol with given name."""
+    symbol = _INTERNED_SYMBOLS.get(name)
+    if symbol is None:
+        symbol = _INTERNED_SYMBOLS.setdefault(name, Symbol(name))
+    return symbol
+
+
+def intern_function_call(name: str, args: Iterable[Expression]) -> FunctionCall:
+    """Return canonical FunctionCall with given name and arguments.
+
+    Function calls with the same name and identical arguments are represented by
+    a single object. Hence, equal subtrees built from interned nodes are shared
+    instead of being duplicated.
+    """
+    args = tuple(args)
+    key = (name, tuple(_interning_key(arg) for arg in args))
+    function_call = _INTERNED_FUNCTION_CALLS.get(key)
+    if function_call is None:
+        function_call = _INTERNED_FUNCTION_CALLS.setdefault(
+            key, FunctionCall(name, args)
+        )
+    return function_call
+
+
+def intern_expression(expression: Expression) -> Expression:
+    """Return canonical version of given expression tree.
+
+    All symbols and function calls in the returned tree are interned, hence
+    structurally equal subtrees (also ones equal to subtrees of other interned
+    trees) are represented by the same object.
+    """
+    if isinstance(expression, FunctionCall):
+        return intern_function_call(
+            expression.name, map(intern_expression, expression.args)
+        )
+    elif isinstance(expression, Symbol):
+        return intern_symbol(expression.name)
+    return expression
+
+
+# Arithmetic functions that are evaluated by `simplify` if all their arguments
+# are numbers.
+_ARITHMETIC_FUNCTIONS = {
+    "add": operator.add,
+    "mul": operator.mul,
+    "sub": operator.sub,
+    "div": operator.truediv,
+    "pow": operator.pow,
+}
+
+# Identity elements of associative and commutative functions, whose nested calls
+# are flattened by `simplify`.
+_IDENTITY_ELEMENTS = {"add": 0, "mul": 1}
+
+
+def simplify(expression: Expression) -> Expression:
+    """Simplify expression tree by folding constants and flattening sums/products.
+
+    The following simplifications are performed:
+    - arithmetic functions of numbers are evaluated,
+    - nested additions and multiplications are flattened, e.g. x + (y + z) becomes
+      a single addition with three arguments,
+    - numbers in additions and multiplications are folded into a single
+      constant, which is dropped if it is the identity element,
+    - like terms in additions are collected, e.g. 2 * x + 3 * x becomes 5 * x.
+
+    The returned tree is interned.
+    """
+    return _simplify(intern_expression(expression))
+
+
+# Maximum number of simplified function calls remembered by `_simplify`.
+_SIMPLIFY_CACHE_SIZE = 4096
+# Simplified function calls keyed by ids of interned nodes. Numbers equal across
+# types (e.g. 2 and 2.0) are distinct in interned trees, but not as dict keys,
+# hence the nodes are not used as keys themselves. Each entry holds its node,
+# so that its id cannot be reused while the entry exists.
+_SIMPLIFIED: Dict[int, Tuple[FunctionCall, Expression]] = {}
+
+
+def _simplify(expression: Expression) -> Expression:
+    if not isinstance(expression, FunctionCall):
+        return expression
+
+    cached = _SIMPLIFIED.get(id(expression))
+    if cached is not None:
+        return cached[1]
+
+    simplified = _simplify_function_call(expression)
+    if len(_SIMPLIFIED) >= _SIMPLIFY_CACHE_SIZE:
+        del _SIMPLIFIED[next(iter(_SIMPLIFIED))]
+    _SIMPLIFIED[id(expression)] = (expression, simplified)
+    return simplified
+
+
+def _simplify_function_call(expression: FunctionCall) -> Expression:
+    name = expression.name
+    args = tuple(map(_simplify, expression.args))
+
+    if name in _IDENTITY_ELEMENTS:
+        return _simplify_commutative_call(name, args)
+
+    if name in _ARITHMETIC_FUNCTIONS and all(isinstance(arg, Number) for arg in args):
+        try:
+            return _ARITHMETIC_FUNCTIONS[name](*args)
+        except (ArithmeticError, ValueError):
+            # e.g. division by zero, left for the dialect to deal with.
+            pass
+
+    return intern_function_call(name, args)
+
+
+def _simplify_commutative_call(name: str, args: Tuple[Expression, ...]) -> Expression:
+    flattened: List[Expression] = []
+    for arg in args:
+        if isinstance(arg, FunctionCall) and arg.name == name:
+            flattened.extend(arg.args)
+        else:
+            flattened.append(arg)
+
+    identity = _IDENTITY_ELEMENTS[name]
+    constant = reduce(
+        _ARITHMETIC_FUNCTIONS[name],
+        (arg for arg in flattened if isinstance(arg, Number)),
+        identity,
+    )
+    terms = [arg for arg in flattened if not isinstance(arg, Number)]
+
+    if name == "add":
+        terms = _collect_like_terms(terms)
+
+    if not terms:
+        return constant
+    if constant != identity:
+        terms.insert(0, constant)
+    return terms[0] if len(terms) == 1 else intern_function_call(name, terms)
+
+
+def _split_coefficient(term: Expression) -> Tuple[Any, Expression]:
+    if (
+        isinstance(term, FunctionCall)
+        and term.name == "mul"
+        and isinstance(term.args[0], Number)
+    ):
+        factors = term.args[1:]
+        return (
+            term.args[0],
+            factors[0] if len(factors) == 1 else intern_function_call("mul", factors),
+        )
+    return 1, term
+
+
+def _collect_like_terms(terms: List[Expression]) -> List[Expression]:
+    # Terms are interned, hence like terms are the same objects and are keyed by
+    # their ids, for the same reason as in `_simplify`.
+    coefficients: Dict[int, Tuple[Expression, Any]] = {}
+    for term in terms:
+        coefficient, rest = _split_coefficient(term)
+        _, total = coefficients.get(id(rest), (rest, 0))
+        coefficients[id(rest)] = (rest, total + coefficient)
+
+    return [
+        (
+            rest
+            if coefficient == 1
+            else _simplify_commutative_call("mul", (coefficient, rest))
+        )
+        for rest, coefficient in coefficients.values()
+        if coefficient != 0
+    ]
+
+
+def substitute(expression: Expression, values: Dict[str, Number]) -> Expression:
+    """Substitute numbers for symbols in expression tree and simplify the result.
+
+    Symbols whose names are keys of `values` are replaced with corresponding
+    numbers, and the resulting tree is simplified with `simplify`, so that
+    subtrees depending only on substituted symbols are folded into constants.
+    This is useful for specializing expressions in which some of the symbols
+    have fixed values before evaluating them many times for the remaining ones.
+    """
+    return simplify(_substitute(expression, values))
+
+
+def _substitute(expression: Expression, values: Dict[str, Number]) -> Expression:
+    if isinstance(expression, FunctionCall):
+        return FunctionCall(
+            expression.name, tuple(_substitute(arg, values) for arg in expression.args)
+        )
+    elif isinstance(expression, Symbol):
+        return values.get(expression.name, expression)
+    return expression
+
+
 class ExpressionDialect(NamedTuple):
     """Dialect of arithmetic expression.
 
@@ -37,8 +312,10 @@ class ExpressionDialect(NamedTuple):
     known_functions: Dict[str, Callable[..., Any]]
 
 
-def reduction(operator):
+def reduction(binary_op):
+    # Not sum(): since Python 3.12 it adds floats with compensated summation, which
+    # can differ from folding the arguments from left to right.
     def _reduction(*args):
-        return reduce(operator, args)
+        return reduce(binary_op, args)
 
     return _reduction
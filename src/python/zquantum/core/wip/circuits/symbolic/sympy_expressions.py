@@ -1,59 +1,74 @@
 """Utilities for converting sympy expressions to our native Expression format."""
+import cmath
 import operator
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from numbers import Number
+from typing import Union
 
 import sympy
 
-from .expressions import ExpressionDialect, FunctionCall, Symbol
+from .expressions import ExpressionDialect, intern_function_call, intern_symbol
 
 
 def is_multiplication_by_reciprocal(sympy_mul: sympy.Mul) -> bool:
     """Check if given sympy multiplication is of the form x * (1 / y)."""
     args = sympy_mul.args
-    return len(args) == 2 and isinstance(args[1], sympy.Pow) and args[1].args[1] == -1
+    return len(args) == 2 and args[1].is_Pow and args[1].exp == -1
 
 
 def is_addition_of_negation(sympy_add: sympy.Add) -> bool:
     """Check if given sympy addition is of the form x + (-y)."""
     args = sympy_add.args
-    return len(args) == 2 and isinstance(args[1], sympy.Mul) and args[1].args[0] == -1
+    return len(args) == 2 and args[1].is_Mul and args[1].args[0] == -1
 
 
-@singledispatch
+@lru_cache(maxsize=4096, typed=True)
 def expression_from_sympy(expression):
-    """Parse Sympy expression into intermediate expression tree."""
+    """Parse Sympy expression into intermediate expression tree.
+
+    Sympy expressions are immutable and hashable, hence results of the translation
+    are memoized. In particular, subexpressions repeated in the translated tree
+    (or across multiple translated trees) are converted only once.
+    """
+    return _expression_from_sympy(expression)
+
+
+@singledispatch
+def _expression_from_sympy(expression):
     raise NotImplementedError(
         f"Expression {expression} of type {type(expression)} is currently not supported"
     )
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def identity(number: Number):
     return number
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def symbol_from_sympy(symbol: sympy.Symbol):
-    return Symbol(str(symbol))
+    # Plain symbols are printed as their names. Reading the name directly avoids
+    # going through sympy's printer, which is costly compared to the rest of the
+    # translation. Subclasses (e.g. Dummy) may be printed differently.
+    return intern_symbol(symbol.name if type(symbol) is sympy.Symbol else str(symbol))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_integer_from_sympy_integer(number: sympy.Integer):
     return int(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_float_from_sympy_float(number: sympy.Float):
     return float(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_float_from_sympy_rational(number: sympy.Rational):
     return float(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_imaginary_unit_from_sympy_imaginary_unit(
     _unit: sympy.core.numbers.ImaginaryUnit,
 ):
@@ -64,51 +79,73 @@ def _negate_sympy_expr(expr):
     return expr * (-1)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def addition_from_sympy_add(add: sympy.Add):
     if is_addition_of_negation(add):
-        return FunctionCall(
+        return intern_function_call(
             "sub",
             (
                 expression_from_sympy(add.args[0]),
                 expression_from_sympy(_negate_sympy_expr(add.args[1])),
             ),
         )
-    return FunctionCall("add", expression_from_sympy(add.args))
+    return intern_function_call("add", expression_from_sympy(add.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def multiplication_from_sympy_mul(mul: sympy.Mul):
     if is_multiplication_by_reciprocal(mul):
-        return FunctionCall(
+        return intern_function_call(
             "div",
             (
                 expression_from_sympy(mul.args[0]),
-                expression_from_sympy(mul.args[1].args[0]),
+                expression_from_sympy(mul.args[1].base),
             ),
         )
     else:
-        return FunctionCall("mul", expression_from_sympy(mul.args))
+        return intern_function_call("mul", expression_from_sympy(mul.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def power_from_sympy_pow(power: sympy.Pow):
-    if power.args[1] == -1:
-        return FunctionCall("div", (1, expression_from_sympy(power.args[0])))
-    elif power.args[1] == 0.5:
-        return FunctionCall("sqrt", (expression_from_sympy(power.args[0]),))
+    exponent = power.exp
+    if exponent == -1:
+        return intern_function_call("div", (1, expression_from_sympy(power.base)))
+    elif exponent == 0.5:
+        return intern_function_call("sqrt", (expression_from_sympy(power.base),))
     else:
-        return FunctionCall("pow", expression_from_sympy(power.args))
+        return intern_function_call("pow", expression_from_sympy(power.args))
+
 
+def _native_number_from_symbol_free_expression(
+    expression: sympy.Expr,
+) -> Union[float, complex]:
+    number = complex(expression)
+    if not cmath.isfinite(number):
+        # e.g. exp(1000) overflows, and is better kept as a function call.
+        raise OverflowError(f"{expression} cannot be represented as native number.")
+    return number.real if number.imag == 0 else number
 
-@expression_from_sympy.register
+
+@_expression_from_sympy.register
 def function_call_from_sympy_function(function: sympy.Function):
-    return FunctionCall(str(function.func), expression_from_sympy(function.args))
+    # Functions applied to constants, e.g. cos(2), are evaluated right away instead
+    # of being translated into function calls.
+    if function.is_number:
+        try:
+            return _native_number_from_symbol_free_expression(function)
+        except (TypeError, OverflowError):
+            # Constant that cannot be evaluated numerically, translated as any
+            # other function call.
+            pass
+    return intern_function_call(
+        type(function).__name__, expression_from_sympy(function.args)
+    )
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def expression_tuple_from_tuple_of_sympy_args(args: tuple):
-    return tuple(expression_from_sympy(arg) for arg in args)
+    return tuple(map(expression_from_sympy, args))
 
 
 # Dialect defining conversion of intermediate expression tree to
@@ -118,8 +155,8 @@ SYMPY_DIALECT = ExpressionDialect(
     symbol_factory=lambda symbol: sympy.Symbol(symbol.name),
     number_factory=lambda number: number,
     known_functions={
-        "add": operator.add,
-        "mul": operator.mul,
+        "add": sympy.Add,
+        "mul": sympy.Mul,
         "div": operator.truediv,
         "sub": operator.sub,
         "pow": operator.pow,
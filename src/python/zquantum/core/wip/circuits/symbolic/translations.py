@@ -1,9 +1,18 @@
 """Utilities related to translation of symbolic expressions."""
 from functools import singledispatch
 from numbers import Number
-from typing import Iterable, Tuple, Union
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple, Union
 
-from .expressions import Expression, ExpressionDialect, FunctionCall, Symbol
+import numpy as np
+
+from .expressions import (
+    Expression,
+    ExpressionDialect,
+    FunctionCall,
+    Symbol,
+    intern_expression,
+)
 
 
 @singledispatch
@@ -25,13 +34,229 @@ def translate_symbol(symbol: Symbol, dialect: ExpressionDialect):
 
 @translate_expression.register
 def translate_function_call(function_call: FunctionCall, dialect: ExpressionDialect):
-    if function_call.name not in dialect.known_functions:
-        raise ValueError(f"Function {function_call.name} is unknown in this dialect.")
-
-    return dialect.known_functions[function_call.name](
-        *translate_tuple(function_call.args, dialect)
-    )
+    return _specialize_translation(dialect)(function_call)
 
 
 def translate_tuple(expression_tuple: Iterable[Expression], dialect: ExpressionDialect):
-    return tuple(translate_expression(element, dialect) for element in expression_tuple)
+    return tuple(map(_specialize_translation(dialect), expression_tuple))
+
+
+def _lookup_function(dialect: ExpressionDialect, name: str) -> Callable[..., Any]:
+    function = dialect.known_functions.get(name)
+    if function is None:
+        raise ValueError(f"Function {name} is unknown in this dialect.")
+    return function
+
+
+def _specialize_translation(dialect: ExpressionDialect) -> Callable[[Expression], Any]:
+    """Create function translating expression trees into given dialect.
+
+    The dialect's factories and functions are bound once and the returned function
+    walks the whole tree by itself, instead of dispatching every node through
+    `translate_expression`. Nodes of other types than the built-in ones are still
+    delegated to `translate_expression`.
+    """
+    symbol_factory = dialect.symbol_factory
+    number_factory = dialect.number_factory
+
+    def _translate(expression: Expression):
+        if isinstance(expression, FunctionCall):
+            function = _lookup_function(dialect, expression.name)
+            return function(*[_translate(arg) for arg in expression.args])
+        elif isinstance(expression, Symbol):
+            return symbol_factory(expression)
+        elif isinstance(expression, Number):
+            return number_factory(expression)
+        return translate_expression(expression, dialect)
+
+    return _translate
+
+
+def translate_with_cse(expression: Expression, dialect: ExpressionDialect):
+    """Translate expression into given dialect, translating each subtree only once.
+
+    The expression is interned first, so that structurally equal subtrees become
+    the same object, and translations of subtrees are reused by their identity
+    (common subexpression elimination). For instance, in a tree containing
+    cos(theta) many times, cos(theta) is translated just once, and all its
+    occurrences in the result refer to the same translated object.
+    """
+    symbol_factory = dialect.symbol_factory
+    number_factory = dialect.number_factory
+    # Keyed by ids of nodes of the interned tree, which is alive for the whole
+    # translation, hence the ids are not reused in the meantime.
+    translated: Dict[int, Any] = {}
+
+    def _translate(expression: Expression):
+        key = id(expression)
+        if key in translated:
+            return translated[key]
+
+        if isinstance(expression, FunctionCall):
+            function = _lookup_function(dialect, expression.name)
+            result = function(*[_translate(arg) for arg in expression.args])
+        elif isinstance(expression, Symbol):
+            result = symbol_factory(expression)
+        elif isinstance(expression, Number):
+            result = number_factory(expression)
+        else:
+            result = translate_expression(expression, dialect)
+
+        translated[key] = result
+        return result
+
+    return _translate(intern_expression(expression))
+
+
+def compile_expression(
+    expression: Expression, symbols: Sequence[Symbol], dialect: ExpressionDialect
+) -> Callable[[Sequence[Any]], Any]:
+    """Compile expression tree into a function evaluating it in given dialect.
+
+    The tree is walked only once, replacing each node with a closure in which
+    the dialect's function is already resolved. The returned function takes
+    a sequence of values of `symbols` (in the same order) and computes the
+    expression with symbols substituted by those values. Symbols not present in
+    `symbols` are translated with the dialect's symbol_factory.
+
+    This is useful when the same expression has to be evaluated for many values
+    of its parameters, e.g. for all points of a parameter grid.
+    """
+    symbol_indices = {symbol: index for index, symbol in enumerate(symbols)}
+    symbol_factory = dialect.symbol_factory
+    number_factory = dialect.number_factory
+
+    def _constant(value):
+        return lambda values: value
+
+    def _compile(expression: Expression) -> Callable[[Sequence[Any]], Any]:
+        if isinstance(expression, FunctionCall):
+            function = _lookup_function(dialect, expression.name)
+            compiled_args = tuple(map(_compile, expression.args))
+            # Unary and binary calls, which are the most common ones, are
+            # compiled without building an intermediate list of arguments.
+            if len(compiled_args) == 1:
+                (arg,) = compiled_args
+                return lambda values: function(arg(values))
+            if len(compiled_args) == 2:
+                left, right = compiled_args
+                return lambda values: function(left(values), right(values))
+            return lambda values: function(*[arg(values) for arg in compiled_args])
+        elif isinstance(expression, Symbol):
+            index = symbol_indices.get(expression)
+            if index is None:
+                return _constant(symbol_factory(expression))
+            return itemgetter(index)
+        elif isinstance(expression, Number):
+            return _constant(number_factory(expression))
+        return _constant(translate_expression(expression, dialect))
+
+    return _compile(expression)
+
+
+# Operators and functions supported by `compile_to_python`. Additions and
+# multiplications take any positive number of arguments and are applied from left
+# to right, just like `reduction` does; other functions take fixed numbers of
+# arguments, like their counterparts in the dialects.
+_PYTHON_OPERATORS = {"add": "+", "mul": "*", "sub": "-", "div": "/", "pow": "**"}
+_VARIADIC_FUNCTIONS = ("add", "mul")
+_ARITIES = {"sub": 2, "div": 2, "pow": 2}
+_NUMPY_FUNCTIONS = {
+    "cos": np.cos,
+    "sin": np.sin,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+    "tan": np.tan,
+}
+
+
+def compile_to_python(
+    expression: Expression, symbols: Sequence[Symbol]
+) -> Callable[[Sequence[Any]], Any]:
+    """Compile expression tree into a single Python function evaluating it.
+
+    Contrary to `compile_expression`, the tree is turned into source code of one
+    lambda, e.g. cos(x) * y becomes `lambda p: (np.cos(p[0]) * p[1])`, hence
+    evaluating it does not involve any calls per node of the tree. The returned
+    function takes a sequence of values of `symbols` (in the same order). As
+    functions are taken from numpy, the values can also be arrays, in which case
+    the expression is evaluated for all of their elements at once.
+
+    Only arithmetic operations and the functions in `_NUMPY_FUNCTIONS` are
+    supported, and all symbols of the expression have to be present in
+    `symbols`. Compiled functions are cached, so compiling the same expression
+    again is cheap. Expressions differing only in types of numbers (e.g. x ** -1
+    and x ** -1.0) are compiled separately.
+    """
+    expression = intern_expression(expression)
+    symbols = tuple(symbols)
+    # Keyed by id of the interned tree, as numbers equal across types (e.g. 2 and
+    # 2.0) are distinct in interned trees, but not as dict keys. Each entry holds
+    # its tree, so that its id cannot be reused while the entry exists.
+    key = (id(expression), symbols)
+    cached = _COMPILED_TO_PYTHON.get(key)
+    if cached is None:
+        if len(_COMPILED_TO_PYTHON) >= _COMPILED_TO_PYTHON_CACHE_SIZE:
+            del _COMPILED_TO_PYTHON[next(iter(_COMPILED_TO_PYTHON))]
+        cached = _COMPILED_TO_PYTHON[key] = (
+            expression,
+            _compile_to_python(expression, symbols),
+        )
+    return cached[1]
+
+
+_COMPILED_TO_PYTHON_CACHE_SIZE = 1024
+_COMPILED_TO_PYTHON: Dict[Tuple[int, Tuple[Symbol, ...]], Tuple[Expression, Any]] = {}
+
+
+def _compile_to_python(
+    expression: Expression, symbols: Tuple[Symbol, ...]
+) -> Callable[[Sequence[Any]], Any]:
+    symbol_indices = {symbol: index for index, symbol in enumerate(symbols)}
+    # Numbers are passed to the compiled code as variables instead of being
+    # formatted into the source, so that all number types are handled exactly.
+    namespace: Dict[str, Any] = {}
+
+    def _source(expression: Expression) -> str:
+        if isinstance(expression, FunctionCall):
+            args_sources = [_source(arg) for arg in expression.args]
+            _check_arity(expression)
+            python_operator = _PYTHON_OPERATORS.get(expression.name)
+            if python_operator is not None:
+                source = args_sources[0]
+                for arg_source in args_sources[1:]:
+                    source = f"({source} {python_operator} {arg_source})"
+                return source
+            function = _NUMPY_FUNCTIONS.get(expression.name)
+            if function is None:
+                raise ValueError(
+                    f"Function {expression.name} cannot be compiled to Python."
+                )
+            namespace[expression.name] = function
+            return f"{expression.name}({', '.join(args_sources)})"
+        elif isinstance(expression, Symbol):
+            index = symbol_indices.get(expression)
+            if index is None:
+                raise ValueError(f"Value of symbol {expression.name} is not given.")
+            return f"p[{index}]"
+        elif isinstance(expression, Number):
+            name = f"c{len(namespace)}"
+            namespace[name] = expression
+            return name
+        raise ValueError(f"Expression {expression} cannot be compiled to Python.")
+
+    source = f"lambda p: {_source(expression)}"
+    return eval(compile(source, "<expression>", "eval"), namespace)
+
+
+def _check_arity(function_call: FunctionCall) -> None:
+    number_of_args = len(function_call.args)
+    if function_call.name in _VARIADIC_FUNCTIONS:
+        valid = number_of_args > 0
+    else:
+        valid = number_of_args == _ARITIES.get(function_call.name, 1)
+    if not valid:
+        raise ValueError(
+            f"Function {function_call.name} cannot be compiled to Python with "
+            f"{number_of_args} arguments."
+        )
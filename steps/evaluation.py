@@ -1,15 +1,11 @@
 import json
-from typing import Dict, List, Union
+import os
+from typing import Any, Callable, Dict, List, Union
 
 import numpy as np
 import zquantum.core.circuit as old_circuit
 import zquantum.core.wip.circuits as new_circuits
 from openfermion import QubitOperator, SymbolicOperator
-from openfermion.linalg import (
-    jw_get_ground_state_at_particle_number as _jw_get_ground_state_at_particle_number,
-)
-from openfermion.linalg import qubit_operator_sparse
-from pyquil.wavefunction import Wavefunction
 from zquantum.core.circuit import (
     Circuit,
     ParameterGrid,
@@ -31,6 +27,9 @@ from zquantum.core.openfermion import (
 from zquantum.core.openfermion import (
     evaluate_qubit_operator_list as _evaluate_qubit_operator_list,
 )
+from zquantum.core.openfermion import (
+    get_ground_state_at_particle_number as _get_ground_state_at_particle_number,
+)
 from zquantum.core.openfermion import (
     get_ground_state_rdm_from_qubit_op as _get_ground_state_rdm_from_qubit_op,
 )
@@ -39,9 +38,38 @@ from zquantum.core.openfermion import (
     load_qubit_operator_set,
     save_interaction_rdm,
     save_parameter_grid_evaluation,
+    save_parameter_grid_result,
 )
 from zquantum.core.typing import Specs
-from zquantum.core.utils import ValueEstimate, create_object, save_value_estimate
+from zquantum.core.utils import (
+    ValueEstimate,
+    create_backend,
+    create_object,
+    save_value_estimate,
+)
+
+# Loaders converting serialized inputs of the steps into objects, keyed by the type
+# of the serialized input (subclasses included). Inputs of other types are assumed
+# to be loaded already.
+_Loaders = Dict[type, Callable[[Any], Any]]
+_CIRCUIT_LOADERS: _Loaders = {
+    str: load_circuit,
+    os.PathLike: lambda path: load_circuit(os.fspath(path)),
+    dict: Circuit.from_dict,
+}
+_QUBIT_OPERATOR_LOADERS: _Loaders = {
+    str: load_qubit_operator,
+    os.PathLike: lambda path: load_qubit_operator(os.fspath(path)),
+    dict: convert_dict_to_qubitop,
+}
+_SPECS_LOADERS: _Loaders = {str: json.loads}
+
+
+def _load_if_needed(value, loaders: _Loaders):
+    for loaded_type, loader in loaders.items():
+        if isinstance(value, loaded_type):
+            return loader(value)
+    return value
 
 
 def get_expectation_values_for_qubit_operator(
@@ -59,24 +87,16 @@ def get_expectation_values_for_qubit_operator(
         circuit: The circuit that prepares the state to be measured
         qubit_operator: The operator to measure
     """
-    if isinstance(circuit, str):
-        circuit = load_circuit(circuit)
-    elif isinstance(circuit, dict):
-        circuit = Circuit.from_dict(circuit)
-    if isinstance(qubit_operator, str):
-        qubit_operator = load_qubit_operator(qubit_operator)
-    elif isinstance(qubit_operator, dict):
-        qubit_operator = convert_dict_to_qubitop(qubit_operator)
-    if isinstance(backend_specs, str):
-        backend_specs = json.loads(backend_specs)
-    backend = create_object(backend_specs)
+    circuit = _load_if_needed(circuit, _CIRCUIT_LOADERS)
+    qubit_operator = _load_if_needed(qubit_operator, _QUBIT_OPERATOR_LOADERS)
+    backend = create_backend(_load_if_needed(backend_specs, _SPECS_LOADERS))
 
     expectation_values = backend.get_expectation_values(circuit, qubit_operator)
     save_expectation_values(expectation_values, "expectation-values.json")
 
 
 def get_ground_state_rdm_from_qubit_operator(
-    qubit_operator: Union[str, QubitOperator], n_particles: int
+    qubit_operator: Union[str, QubitOperator, Dict], n_particles: int
 ):
     """Diagonalize operator and compute the ground state 1- and 2-RDM
 
@@ -84,7 +104,7 @@ def get_ground_state_rdm_from_qubit_operator(
         qubit_operator: The openfermion operator to diagonalize
         n_particles: number of particles in the target ground state
     """
-    qubit_operator = load_qubit_operator(qubit_operator)
+    qubit_operator = _load_if_needed(qubit_operator, _QUBIT_OPERATOR_LOADERS)
     rdm = _get_ground_state_rdm_from_qubit_op(qubit_operator, n_particles)
     save_interaction_rdm(rdm, "rdms.json")
 
@@ -95,12 +115,15 @@ def evaluate_operator_for_parameter_grid(
     grid: Union[str, ParameterGrid],
     operator: Union[str, SymbolicOperator],
     fixed_parameters: Union[List[float], np.ndarray, str] = None,
+    num_workers: int = 1,
+    legacy_json: bool = True,
 ):
     """Measure the exception values of the terms in an input operator with respect to
     the states prepared by the input ansatz circuits when set to the different
     parameters in the input parameter grid on the backend described by the
     `backend_specs`. The results are serialized into a JSON under the files:
-    "parameter-grid-evaluation.json" and "optimal-parameters.json"
+    "parameter-grid-evaluation.json" and "optimal-parameters.json", or, if
+    `legacy_json` is False, into a single file "parameter-grid-result.npz"
 
     Args:
         ansatz_specs: The ansatz producing the parameterized quantum circuits
@@ -109,37 +132,44 @@ def evaluate_operator_for_parameter_grid(
         operator: The operator to measure
         fixed_parameters: Any fixed parameter values that the ansatz should be
             evaluated to that are not described by the parameter grid
+        num_workers: Number of processes evaluating the grid points in parallel
+        legacy_json: Whether to save the results into two JSON files instead of
+            a single .npz file
     """
-    if isinstance(ansatz_specs, str):
-        ansatz_specs = json.loads(ansatz_specs)
-    ansatz = create_object(ansatz_specs)
-
-    if isinstance(backend_specs, str):
-        backend_specs = json.loads(backend_specs)
-    backend = create_object(backend_specs)
+    ansatz = create_object(_load_if_needed(ansatz_specs, _SPECS_LOADERS))
+    backend = create_backend(_load_if_needed(backend_specs, _SPECS_LOADERS))
 
     if isinstance(grid, str):
         grid = load_parameter_grid(grid)
-    if isinstance(operator, str):
-        operator = load_qubit_operator(operator)
+    operator = _load_if_needed(operator, _QUBIT_OPERATOR_LOADERS)
 
-    if fixed_parameters is not None:
-        if isinstance(fixed_parameters, str):
-            fixed_parameters = load_circuit_template_params(fixed_parameters)
-    else:
-        fixed_parameters = []
+    if fixed_parameters is None:
+        fixed_parameters = np.empty(0, dtype=np.float64)
+    elif isinstance(fixed_parameters, str):
+        fixed_parameters = load_circuit_template_params(fixed_parameters)
+    fixed_parameters = np.ascontiguousarray(fixed_parameters, dtype=np.float64)
 
     (
         parameter_grid_evaluation,
         optimal_parameters,
     ) = _evaluate_operator_for_parameter_grid(
-        ansatz, grid, backend, operator, previous_layer_params=fixed_parameters
+        ansatz,
+        grid,
+        backend,
+        operator,
+        previous_layer_params=fixed_parameters,
+        num_workers=num_workers,
     )
 
-    save_parameter_grid_evaluation(
-        parameter_grid_evaluation, "parameter-grid-evaluation.json"
-    )
-    save_circuit_template_params(optimal_parameters, "optimal-parameters.json")
+    if legacy_json:
+        save_parameter_grid_evaluation(
+            parameter_grid_evaluation, "parameter-grid-evaluation.json"
+        )
+        save_circuit_template_params(optimal_parameters, "optimal-parameters.json")
+    else:
+        save_parameter_grid_result(
+            parameter_grid_evaluation, optimal_parameters, "parameter-grid-result.npz"
+        )
 
 
 def jw_get_ground_state_at_particle_number(
@@ -154,17 +184,15 @@ def jw_get_ground_state_at_particle_number(
         particle_number: The given number of particles in the system
         qubit_operator: The operator for which to find the ground state
     """
-    if isinstance(qubit_operator, str):
-        qubit_operator = load_qubit_operator(qubit_operator)
-    sparse_matrix = qubit_operator_sparse(qubit_operator)
-
-    ground_energy, ground_state_amplitudes = _jw_get_ground_state_at_particle_number(
-        sparse_matrix, particle_number
+    qubit_operator = _load_if_needed(qubit_operator, _QUBIT_OPERATOR_LOADERS)
+    # The operator is diagonalized only in the subspace with given particle number,
+    # without building its sparse matrix on the whole Hilbert space.
+    ground_energy, ground_state_amplitudes = _get_ground_state_at_particle_number(
+        qubit_operator, particle_number
     )
-    ground_state = Wavefunction(ground_state_amplitudes)
     value_estimate = ValueEstimate(ground_energy)
 
-    save_wavefunction(ground_state, "ground-state.json")
+    save_wavefunction(ground_state_amplitudes, "ground-state.json")
     save_value_estimate(value_estimate, "value-estimate.json")
 
 
@@ -29,6 +29,7 @@ from zquantum.core.openfermion import (
 )
 from zquantum.core.typing import Specs
 from zquantum.core.utils import (
+    create_backend,
     create_object,
     load_noise_model,
     save_list,
@@ -53,7 +54,7 @@ def run_circuit_and_measure(
             device_connectivity
         )
 
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
     if isinstance(circuit, str):
         circuit = load_circuit(circuit)
     else:
@@ -81,7 +82,7 @@ def run_circuitset_and_measure(
         )
 
     circuit_set = load_circuit_set(circuitset)
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
 
     measurements_set = backend.run_circuitset_and_measure(
         circuit_set, n_samples=n_samples
@@ -105,7 +106,7 @@ def get_bitstring_distribution(
             device_connectivity
         )
 
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
     circuit = load_circuit(circuit)
 
     bitstring_distribution = backend.get_bitstring_distribution(circuit)
@@ -141,7 +142,7 @@ def evaluate_ansatz_based_cost_function(
             device_connectivity
         )
 
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
 
     if isinstance(cost_function_specs, str):
         cost_function_specs = json.loads(cost_function_specs)
@@ -19,7 +19,7 @@ from zquantum.core.estimation import (
     estimate_expectation_values_by_averaging,
 )
 from zquantum.core.serialization import save_optimization_results
-from zquantum.core.utils import create_object, load_list
+from zquantum.core.utils import create_backend, create_object, load_list
 from zquantum.core.typing import Specs
 from zquantum.core.openfermion import load_qubit_operator
 
@@ -75,7 +75,7 @@ def optimize_parametrized_circuit_for_ground_state_of_operator(
 
     if isinstance(backend_specs, str):
         backend_specs = json.loads(backend_specs)
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
 
     if estimation_method_specs is not None:
         if isinstance(estimation_method_specs, str):
@@ -181,7 +181,7 @@ def optimize_ansatz_based_cost_function(
 
     if isinstance(backend_specs, str):
         backend_specs = json.loads(backend_specs)
-    backend = create_object(backend_specs)
+    backend = create_backend(backend_specs)
 
     if estimation_method_specs is not None:
         if isinstance(estimation_method_specs, str):
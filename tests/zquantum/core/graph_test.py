@@ -45,6 +45,22 @@ class TestGraph(unittest.TestCase):
 
         os.remove("Graph.json")
 
+    def test_graph_io_preserves_weights_and_tuple_nodes(self):
+        # Given
+        G = nx.Graph()
+        G.add_node((0, 0), color="red")
+        G.add_edges_from([((0, 0), (0, 1)), ((0, 1), (1, 1))], weight=0.5)
+
+        # When
+        save_graph(G, "Graph.json")
+        G2 = load_graph("Graph.json")
+
+        # Then
+        self.assertEqual(list(G2.nodes(data=True)), list(G.nodes(data=True)))
+        self.assertEqual(list(G2.edges(data=True)), list(G.edges(data=True)))
+
+        os.remove("Graph.json")
+
     def test_generate_graph_node_dict(self):
         # Given
         G = nx.Graph()
@@ -183,6 +199,44 @@ class TestGraph(unittest.TestCase):
         # Then
         self.assertTrue(compare_graphs(graph, target_graph))
 
+    def test_random_weights_are_reproducible_with_seed(self):
+        # Given
+        num_nodes = 6
+        degree = 3
+        seed = 123
+
+        target_graph = generate_random_regular_graph(
+            num_nodes, degree, random_weights=True, seed=seed
+        )
+
+        # When
+        graph = generate_random_regular_graph(
+            num_nodes, degree, random_weights=True, seed=seed
+        )
+
+        # Then
+        for edge in graph.edges:
+            weight = graph.edges[edge]["weight"]
+            self.assertEqual(weight, target_graph.edges[edge]["weight"])
+            self.assertTrue(0 <= weight < 1)
+
+    def test_erdos_renyi_graph_is_reproducible_with_seed(self):
+        # Given
+        num_nodes = 10
+        probability = 0.5
+        seed = 123
+
+        target_graph = generate_random_graph_erdos_renyi(
+            num_nodes, probability, seed=seed
+        )
+
+        # When
+        graph = generate_random_graph_erdos_renyi(num_nodes, probability, seed=seed)
+
+        # Then
+        self.assertEqual(list(graph.nodes), list(range(num_nodes)))
+        self.assertEqual(list(graph.edges), list(target_graph.edges))
+
     def test_generate_graph_from_specs(self):
         # Given
         specs = {"type_graph": "erdos_renyi", "num_nodes": 3, "probability": 1.0}
@@ -226,3 +280,11 @@ class TestGraph(unittest.TestCase):
         # Then
         for edge in graph.edges:
             self.assertIn("weight", graph.edges[edge].keys())
+
+    def test_generate_graph_from_specs_fails_for_unsupported_graph_type(self):
+        # Given
+        specs = {"type_graph": "star", "num_nodes": 4}
+
+        # When/Then
+        with self.assertRaises(NotImplementedError):
+            generate_graph_from_specs(specs)
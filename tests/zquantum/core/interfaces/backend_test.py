@@ -0,0 +1,54 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+from openfermion import QubitOperator
+from pyquil.wavefunction import Wavefunction
+from zquantum.core.interfaces.backend import QuantumSimulator
+from zquantum.core.openfermion import _utils, get_expectation_value
+
+
+class _AmplitudesSimulator(QuantumSimulator):
+    """Simulator whose "circuits" are just amplitudes of the states they prepare."""
+
+    def __init__(self, n_samples=None):
+        super().__init__(n_samples)
+
+    def run_circuit_and_measure(self, circuit, n_samples=None, **kwargs):
+        raise NotImplementedError
+
+    def get_wavefunction(self, circuit, **kwargs):
+        super().get_wavefunction(circuit)
+        return Wavefunction(np.asarray(circuit, dtype=complex))
+
+
+@pytest.mark.parametrize("supports_batching", [False, True])
+def test_exact_expectation_values_for_circuitset_build_term_matrices_once(
+    supports_batching,
+):
+    simulator = _AmplitudesSimulator()
+    simulator.supports_batching = supports_batching
+    simulator.batch_size = 2
+    operator = QubitOperator("0.5 [Z0] - [X0 Y1] + 2 [X1]")
+    circuits = [
+        np.array([1, 0, 0, 0]),
+        np.array([1, 1, 1j, -1]) / 2,
+        np.array([0, 1, 1, 0]) / np.sqrt(2),
+    ]
+
+    with mock.patch.object(
+        _utils, "get_sparse_operator", wraps=_utils.get_sparse_operator
+    ) as get_sparse_operator:
+        expectation_values_set = simulator.get_expectation_values_for_circuitset(
+            circuits, operator
+        )
+
+    assert get_sparse_operator.call_count == len(operator.terms)
+    for circuit, expectation_values in zip(circuits, expectation_values_set):
+        np.testing.assert_allclose(
+            expectation_values.values,
+            [
+                get_expectation_value(term, Wavefunction(circuit)).real
+                for term in operator
+            ],
+        )
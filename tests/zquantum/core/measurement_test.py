@@ -96,6 +96,14 @@ def test_imag_wavefunction_io():
     remove_file_if_exists("wavefunction.json")
 
 
+def test_wavefunction_amplitudes_array_io():
+    amplitudes = np.array([0, 1j, 0, 0, 0, 0, 0, 0])
+    save_wavefunction(amplitudes, "wavefunction.json")
+    loaded_wf = load_wavefunction("wavefunction.json")
+    assert np.allclose(amplitudes, loaded_wf.amplitudes)
+    remove_file_if_exists("wavefunction.json")
+
+
 def test_sample_from_wavefunction():
     wavefunction = create_random_wavefunction(4)
 
@@ -25,17 +25,24 @@ from zquantum.core.openfermion._io import (
     load_interaction_operator,
     load_interaction_rdm,
     load_ising_operator,
+    load_parameter_grid_result,
     load_qubit_operator,
     load_qubit_operator_set,
     save_interaction_operator,
     save_interaction_rdm,
     save_ising_operator,
     save_parameter_grid_evaluation,
+    save_parameter_grid_result,
     save_qubit_operator,
     save_qubit_operator_set,
 )
 from zquantum.core.openfermion._utils import evaluate_operator_for_parameter_grid
-from zquantum.core.utils import SCHEMA_VERSION, convert_dict_to_array, create_object
+from zquantum.core.utils import (
+    SCHEMA_VERSION,
+    ValueEstimate,
+    convert_dict_to_array,
+    create_object,
+)
 
 
 class TestQubitOperator(unittest.TestCase):
@@ -189,6 +196,40 @@ class TestQubitOperator(unittest.TestCase):
         if failed_to_remove:
             raise RuntimeError(f"Failed to remove files: {failed_to_remove}")
 
+    def test_parameter_grid_result_io(self):
+        # Given
+        ansatz = MockAnsatz(2, 2)
+        grid = build_uniform_param_grid(1, 2, 0, np.pi, np.pi / 10)
+        backend = create_object(
+            {
+                "module_name": "zquantum.core.interfaces.mock_objects",
+                "function_name": "MockQuantumSimulator",
+            }
+        )
+        op = QubitOperator("0.5 [] + 0.5 [Z1]")
+        (
+            parameter_grid_evaluation,
+            optimal_parameters,
+        ) = evaluate_operator_for_parameter_grid(ansatz, grid, backend, op)
+        parameter_grid_evaluation[0]["value"] = ValueEstimate(0.25, precision=0.1)
+
+        # When
+        save_parameter_grid_result(
+            parameter_grid_evaluation, optimal_parameters, "parameter-grid-result.npz"
+        )
+        (
+            loaded_parameter_grid_evaluation,
+            loaded_optimal_parameters,
+        ) = load_parameter_grid_result("parameter-grid-result.npz")
+
+        # Then
+        self.assertEqual(loaded_parameter_grid_evaluation, parameter_grid_evaluation)
+        self.assertEqual(loaded_parameter_grid_evaluation[0]["value"].precision, 0.1)
+        self.assertIsNone(loaded_parameter_grid_evaluation[1]["value"].precision)
+        np.testing.assert_array_equal(loaded_optimal_parameters, optimal_parameters)
+
+        os.remove("parameter-grid-result.npz")
+
     def test_interaction_rdm_io(self):
         # Given
 
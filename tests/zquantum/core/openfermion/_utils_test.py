@@ -1,5 +1,7 @@
+import copy
 import random
 import unittest
+from unittest import mock
 
 import numpy as np
 import pkg_resources
@@ -16,8 +18,13 @@ from openfermion import (
     qubit_operator_sparse,
 )
 from openfermion.hamiltonians import fermi_hubbard
-from openfermion.linalg import jw_get_ground_state_at_particle_number
+from openfermion.linalg import (
+    jw_get_ground_state_at_particle_number,
+    jw_number_restrict_operator,
+)
+from pyquil.wavefunction import Wavefunction
 from zquantum.core.circuit import Circuit, Gate, Qubit, build_uniform_param_grid
+from zquantum.core.interfaces.backend import QuantumSimulator
 from zquantum.core.interfaces.mock_objects import MockAnsatz
 from zquantum.core.measurement import ExpectationValues
 from zquantum.core.openfermion._io import load_interaction_operator
@@ -30,11 +37,15 @@ from zquantum.core.openfermion._utils import (
     generate_random_qubitop,
     get_diagonal_component,
     get_expectation_value,
+    get_expectation_values_of_terms,
+    get_sparse_operators_of_terms,
     get_fermion_number_operator,
+    get_ground_state_at_particle_number,
     get_ground_state_rdm_from_qubit_op,
     get_polynomial_tensor,
     get_qubitop_from_coeffs_and_labels,
     get_qubitop_from_matrix,
+    get_sparse_operator_at_particle_number,
     qubitop_to_paulisum,
     remove_inactive_orbitals,
     reverse_qubit_order,
@@ -42,6 +53,42 @@ from zquantum.core.openfermion._utils import (
 from zquantum.core.utils import RNDSEED, create_object, hf_rdm
 
 
+class _UnitarySimulator(QuantumSimulator):
+    """Deterministic simulator, defined at module level to be picklable."""
+
+    def __init__(self):
+        super().__init__(n_samples=None)
+
+    def run_circuit_and_measure(self, circuit, n_samples=None, **kwargs):
+        raise NotImplementedError
+
+    def get_wavefunction(self, circuit):
+        super().get_wavefunction(circuit)
+        return Wavefunction(circuit.to_unitary()[:, 0])
+
+
+class _ForkLikeExecutor:
+    """Runs tasks in process, each on a copy of the backend and starting from the
+    same state of the global random generators, as forked workers would."""
+
+    def __init__(self, max_workers):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def map(self, fn, backends, *iterables):
+        random_state = random.getstate()
+        np_random_state = np.random.get_state()
+        for backend, *args in zip(backends, *iterables):
+            random.setstate(random_state)
+            np.random.set_state(np_random_state)
+            yield fn(copy.deepcopy(backend), *args)
+
+
 class TestQubitOperator(unittest.TestCase):
     def test_build_qubitoperator_from_coeffs_and_labels(self):
         # Given
@@ -160,6 +207,106 @@ class TestQubitOperator(unittest.TestCase):
         self.assertEqual(optimal_parameters[0], 1)
         self.assertEqual(optimal_parameters[1], 1)
 
+    def test_evaluate_operator_for_parameter_grid_skips_nan_values(self):
+        # Given
+        ansatz = MockAnsatz(2, 2)
+        grid = build_uniform_param_grid(1, 2, 0, np.pi, np.pi / 2)
+        backend = create_object(
+            {
+                "module_name": "zquantum.core.interfaces.mock_objects",
+                "function_name": "MockQuantumSimulator",
+            }
+        )
+        values = [[0.5], [np.nan], [-0.5], [np.nan]]
+        backend.get_expectation_values_for_circuitset = mock.Mock(
+            return_value=[ExpectationValues(np.array(value)) for value in values]
+        )
+        op = QubitOperator("[Z0]")
+
+        # When
+        _, optimal_parameters = evaluate_operator_for_parameter_grid(
+            ansatz, grid, backend, op
+        )
+
+        # Then
+        np.testing.assert_array_equal(optimal_parameters, grid.params_list[2])
+
+    def test_evaluate_operator_for_parameter_grid_in_parallel(self):
+        # Given
+        ansatz = MockAnsatz(4, 2)
+        grid = build_uniform_param_grid(1, 2, 0, np.pi, np.pi / 4)
+        serial_backend = _UnitarySimulator()
+        parallel_backend = _UnitarySimulator()
+        op = QubitOperator("0.5 [] + 0.5 [Z1]")
+
+        # When
+        (
+            serial_parameter_grid_evaluation,
+            serial_optimal_parameters,
+        ) = evaluate_operator_for_parameter_grid(
+            ansatz, grid, serial_backend, op, previous_layer_params=[1, 1]
+        )
+        (
+            parameter_grid_evaluation,
+            optimal_parameters,
+        ) = evaluate_operator_for_parameter_grid(
+            ansatz,
+            grid,
+            parallel_backend,
+            op,
+            previous_layer_params=[1, 1],
+            num_workers=3,
+        )
+
+        # Then
+        self.assertEqual(len(parameter_grid_evaluation), len(grid.params_list))
+        for evaluation, serial_evaluation, params in zip(
+            parameter_grid_evaluation,
+            serial_parameter_grid_evaluation,
+            grid.params_list,
+        ):
+            self.assertIsInstance(evaluation["value"].value, float)
+            self.assertEqual(
+                evaluation["value"].value, serial_evaluation["value"].value
+            )
+            self.assertEqual(evaluation["parameter1"], params[0])
+            self.assertEqual(evaluation["parameter2"], params[1])
+        np.testing.assert_array_equal(optimal_parameters, serial_optimal_parameters)
+        self.assertEqual(
+            parallel_backend.number_of_circuits_run,
+            serial_backend.number_of_circuits_run,
+        )
+        self.assertEqual(
+            parallel_backend.number_of_jobs_run, serial_backend.number_of_jobs_run
+        )
+        self.assertEqual(parallel_backend.number_of_circuits_run, len(grid.params_list))
+
+    def test_evaluate_operator_for_parameter_grid_seeds_workers_independently(self):
+        # Given
+        ansatz = MockAnsatz(4, 2)
+        grid = build_uniform_param_grid(1, 2, 0, np.pi, np.pi / 4)
+        backend = create_object(
+            {
+                "module_name": "zquantum.core.interfaces.mock_objects",
+                "function_name": "MockQuantumSimulator",
+            }
+        )
+        op = QubitOperator("0.5 [] + 0.5 [Z1]")
+
+        # When
+        with mock.patch(
+            "zquantum.core.openfermion._utils.ProcessPoolExecutor", _ForkLikeExecutor
+        ):
+            parameter_grid_evaluation, _ = evaluate_operator_for_parameter_grid(
+                ansatz, grid, backend, op, previous_layer_params=[1, 1], num_workers=2
+            )
+
+        # Then
+        values = [evaluation["value"].value for evaluation in parameter_grid_evaluation]
+        chunk_size = len(values) // 2
+        self.assertNotEqual(values[:chunk_size], values[chunk_size:])
+        self.assertEqual(backend.number_of_circuits_run, len(grid.params_list))
+
     def test_reverse_qubit_order(self):
         # Given
         op1 = QubitOperator("[Z0 Z1]")
@@ -190,6 +337,32 @@ class TestQubitOperator(unittest.TestCase):
         self.assertAlmostEqual(-1, exp_op1)
         self.assertAlmostEqual(1, exp_op2)
 
+    def test_get_expectation_values_of_terms(self):
+        # Given
+        wf = pyquil.wavefunction.Wavefunction(np.array([1, 0, 1j, 0, 0, 1, 0, -1]) / 2)
+        qubit_op = QubitOperator("0.5 [Z0] - [X0 Y2] + 2 [X1] + 3 []")
+
+        for reverse_operator in [True, False]:
+            # When
+            expectation_values = get_expectation_values_of_terms(
+                qubit_op, wf, reverse_operator
+            )
+            sparse_operators = get_sparse_operators_of_terms(
+                qubit_op, 3, reverse_operator
+            )
+            expectation_values_from_sparse_operators = get_expectation_values_of_terms(
+                qubit_op, wf, reverse_operator, sparse_operators
+            )
+
+            # Then
+            target_expectation_values = [
+                get_expectation_value(term, wf, reverse_operator) for term in qubit_op
+            ]
+            np.testing.assert_allclose(expectation_values, target_expectation_values)
+            np.testing.assert_allclose(
+                expectation_values_from_sparse_operators, target_expectation_values
+            )
+
     def test_change_operator_type(self):
         # Given
         operator1 = QubitOperator("Z0 Z1", 4.5)
@@ -437,6 +610,93 @@ class TestOtherUtils(unittest.TestCase):
         # Then
         self.assertAlmostEqual(e, rdm.expectation(fhm_int))
 
+    def test_get_sparse_operator_at_particle_number(self):
+        # Given
+        n_qubits = 4
+        qubit_operator = (
+            QubitOperator("X0 Y1 Z3", 0.5)
+            + QubitOperator("Y0 Y2", -1.5)
+            + QubitOperator("X1 X2 X3", 0.25)
+            + QubitOperator("Z2", 2.0)
+            + QubitOperator("", 1.0)
+        )
+
+        for particle_number in range(n_qubits + 1):
+            # When
+            sparse_operator = get_sparse_operator_at_particle_number(
+                qubit_operator, particle_number, n_qubits
+            )
+
+            # Then
+            expected_sparse_operator = jw_number_restrict_operator(
+                get_sparse_operator(qubit_operator, n_qubits=n_qubits),
+                particle_number,
+                n_qubits,
+            )
+            np.testing.assert_allclose(
+                sparse_operator.toarray(), expected_sparse_operator.toarray()
+            )
+
+    def test_get_ground_state_at_particle_number(self):
+        # Given
+        n_sites = 2
+        fhm_qubit = jordan_wigner(
+            fermi_hubbard(
+                x_dimension=n_sites,
+                y_dimension=1,
+                tunneling=1.0,
+                coulomb=5.0,
+                chemical_potential=2.5,
+                spinless=False,
+            )
+        )
+        sparse_operator = get_sparse_operator(fhm_qubit)
+
+        for particle_number in range(1, 2 * n_sites):
+            expected_energy, expected_state = jw_get_ground_state_at_particle_number(
+                sparse_operator, particle_number
+            )
+
+            # When
+            energy, state = get_ground_state_at_particle_number(
+                fhm_qubit, particle_number
+            )
+
+            # Then
+            self.assertAlmostEqual(energy, expected_energy)
+            self.assertAlmostEqual(np.vdot(state, sparse_operator @ state), energy)
+            self.assertAlmostEqual(np.linalg.norm(state), 1)
+
+    def test_get_ground_state_at_particle_number_for_sequence_of_operators(self):
+        # Given
+        hamiltonians = [
+            jordan_wigner(
+                fermi_hubbard(
+                    x_dimension=3,
+                    y_dimension=1,
+                    tunneling=1.0,
+                    coulomb=coulomb,
+                    chemical_potential=0.5,
+                    spinless=False,
+                )
+            )
+            for coulomb in [4.0, 4.1, -2.0, 0.0]
+        ]
+        particle_number = 3
+
+        for hamiltonian in hamiltonians:
+            expected_energy, _ = jw_get_ground_state_at_particle_number(
+                get_sparse_operator(hamiltonian), particle_number
+            )
+
+            # When
+            energy, _ = get_ground_state_at_particle_number(
+                hamiltonian, particle_number
+            )
+
+            # Then
+            self.assertAlmostEqual(energy, expected_energy)
+
     def test_remove_inactive_orbitals(self):
         fermion_ham = load_interaction_operator(
             pkg_resources.resource_filename("zquantum.core.testing", "hamiltonian_HeH_plus_STO-3G.json")
@@ -162,6 +162,27 @@ def test_save_optimization_results_successfully_saves_optimization_result():
     os.remove(optimization_result_filename)
 
 
+def test_save_optimization_results_writes_non_string_keys_like_json_module():
+    result_to_serialize = optimization_result(
+        opt_value=0.5,
+        opt_params=np.array([0, 0.5]),
+        artifacts={True: 1, False: 2, None: 3, 0.5: 4, float("inf"): 5, 6: 7},
+    )
+    optimization_result_filename = "test-optimization-result-keys.json"
+
+    save_optimization_results(result_to_serialize, optimization_result_filename)
+
+    with open(optimization_result_filename, "r") as f:
+        loaded_data = json.load(f)
+
+    assert loaded_data == json.loads(json.dumps(result_to_serialize, cls=OrquestraEncoder))
+    assert set(loaded_data["artifacts"]) == {
+        "true", "false", "null", "0.5", "Infinity", "6"
+    }
+
+    os.remove(optimization_result_filename)
+
+
 def test_orquestra_decoder_can_load_numpy_arrays():
     dict_of_arrays = {
         "array_1": {"real": [1, 2, 3, 4]},
@@ -9,6 +9,8 @@ import pytest
 import sympy
 from types import FunctionType
 from scipy.stats import unitary_group
+from zquantum.core.interfaces.mock_objects import MockQuantumSimulator
+from zquantum.core import utils
 from zquantum.core.openfermion import load_interaction_operator
 from zquantum.core.utils import (
     RNDSEED,
@@ -18,6 +20,7 @@ from zquantum.core.utils import (
     compare_unitary,
     convert_array_to_dict,
     convert_dict_to_array,
+    create_backend,
     create_object,
     create_symbols_map,
     dec2bin,
@@ -208,6 +211,33 @@ class TestUtils:
         assert type(mock_simulator).__name__ == function_name
         assert mock_simulator.n_samples == n_samples
 
+    def test_create_backend_reuses_only_stateless_backends(self, monkeypatch):
+        # Given
+        specs = {
+            "module_name": "zquantum.core.interfaces.mock_objects",
+            "function_name": "MockQuantumSimulator",
+            "n_samples": 100,
+        }
+
+        monkeypatch.setattr(utils, "_CACHED_BACKENDS", {})
+
+        # When/Then
+        assert create_backend(specs) is not create_backend(specs)
+
+        # When
+        monkeypatch.setattr(MockQuantumSimulator, "is_stateless", True)
+        backend = create_backend(specs)
+
+        # Then
+        assert create_backend(dict(reversed(list(specs.items())))) is backend
+        assert create_backend({**specs, "n_samples": 10}) is not backend
+
+        # When
+        monkeypatch.setattr(MockQuantumSimulator, "is_stateless", False)
+
+        # Then
+        assert create_backend(specs) is not backend
+
     def test_create_object_func_without_kwargs(self):
         self.test_get_func_from_specs()
 
@@ -42,6 +42,7 @@ class TestMultiPhaseOperation:
         [
             (np.array([1, 1, 1, 1]) / 2, (3j, 1, 2, 0)),
             (np.array([1, 1, 1, 1]) / 2, (0, 1 + 1j, 2, 3j)),
+            (np.array([1, 1, 1, 1]) / 2, (sympy.Symbol("theta"), 1, 2j, 0)),
         ],
     )
     def test_cannot_be_applied_if_params_are_not_real(self, wavefunction, params):
@@ -110,3 +111,34 @@ class TestMultiPhaseOperation:
         operation = MultiPhaseOperation(params)
         with pytest.raises(RuntimeError):
             operation.apply(wavefunction)
+
+    @pytest.mark.parametrize(
+        "n_params,expected_qubit_indices",
+        [(1, ()), (2, (0,)), (4, (0, 1)), (8, (0, 1, 2))],
+    )
+    def test_qubit_indices_are_inferred_from_number_of_params(
+        self, n_params, expected_qubit_indices
+    ):
+        operation = MultiPhaseOperation(tuple(np.zeros(n_params)))
+
+        assert operation.qubit_indices == expected_qubit_indices
+
+    def test_can_be_applied_after_binding_all_symbolic_params(self):
+        alpha, beta = sympy.symbols("alpha, beta")
+        wavefunction = np.array([1, 1, 1, 1]) / 2
+        operation = MultiPhaseOperation((alpha, beta, 0, np.pi)).bind(
+            {alpha: np.pi / 2, beta: np.pi / 2}
+        )
+
+        np.testing.assert_allclose(
+            operation.apply(wavefunction), np.array([1j, 1j, 1, -1]) / 2, atol=1e-12
+        )
+
+    def test_binding_equal_symbols_maps_gives_the_same_operation(self):
+        alpha, beta = sympy.symbols("alpha, beta")
+        operation = MultiPhaseOperation((alpha, beta, 0, np.pi))
+
+        bound = operation.bind({alpha: 0.5, beta: 1.0})
+
+        assert operation.bind({beta: 1.0, alpha: 0.5}) is bound
+        assert operation.bind({alpha: 0.5, beta: 2.0}).params == (0.5, 2.0, 0, np.pi)
@@ -0,0 +1,211 @@
+"""Test cases for expressions module."""
+import functools
+import operator
+import pickle
+import sys
+
+import pytest
+from zquantum.core.wip.circuits.symbolic.expressions import (
+    FunctionCall,
+    Symbol,
+    intern_expression,
+    intern_function_call,
+    intern_symbol,
+    reduction,
+    simplify,
+    substitute,
+)
+
+
+def test_interned_symbols_with_the_same_name_are_the_same_object():
+    assert intern_symbol("theta") is intern_symbol("theta")
+
+
+def test_interned_symbol_is_equal_to_symbol_constructed_directly():
+    assert intern_symbol("theta") == Symbol("theta")
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("add", (1, 2)),
+        ("cos", (intern_symbol("x"),)),
+        ("mul", (2.5, intern_function_call("sin", (intern_symbol("y"),)))),
+    ],
+)
+def test_interned_function_calls_with_identical_args_are_the_same_object(name, args):
+    function_call = intern_function_call(name, args)
+
+    assert function_call == FunctionCall(name, args)
+    assert intern_function_call(name, args) is function_call
+
+
+@pytest.mark.parametrize(
+    "name, args, other_name, other_args",
+    [
+        ("add", (1, 2), "mul", (1, 2)),
+        ("pow", (intern_symbol("x"), 2), "pow", (intern_symbol("x"), 2.0)),
+        ("cos", (intern_symbol("x"),), "cos", (intern_symbol("y"),)),
+        ("add", (intern_symbol("x"), 0.0), "add", (intern_symbol("x"), -0.0)),
+        ("mul", (2, 1j), "mul", (2, complex(-0.0, 1))),
+    ],
+)
+def test_function_calls_differing_in_name_or_args_types_are_not_merged(
+    name, args, other_name, other_args
+):
+    function_call = intern_function_call(name, args)
+    other_function_call = intern_function_call(other_name, other_args)
+
+    assert function_call is not other_function_call
+    assert type(function_call.args[-1]) is type(args[-1])
+    assert type(other_function_call.args[-1]) is type(other_args[-1])
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        Symbol("x"),
+        FunctionCall("add", (Symbol("x"), 2)),
+        FunctionCall("cos", (FunctionCall("mul", (1.5, Symbol("y"))),)),
+    ],
+)
+class TestExpressionNodes:
+    def test_do_not_have_instance_dict(self, expression):
+        assert not hasattr(expression, "__dict__")
+
+    def test_are_equal_to_their_structural_copies(self, expression):
+        copy = pickle.loads(pickle.dumps(expression))
+
+        assert copy is not expression
+        assert copy == expression
+        assert hash(copy) == hash(expression)
+
+
+def test_interning_expression_makes_equal_subtrees_the_same_object():
+    expression = FunctionCall(
+        "add",
+        (
+            FunctionCall("cos", (Symbol("theta"),)),
+            FunctionCall("mul", (2, FunctionCall("cos", (Symbol("theta"),)))),
+        ),
+    )
+
+    interned = intern_expression(expression)
+
+    assert interned == expression
+    assert interned.args[0] is interned.args[1].args[1]
+    assert intern_expression(expression) is interned
+
+
+X = Symbol("x")
+Y = Symbol("y")
+
+
+@pytest.mark.parametrize(
+    "expression, expected_simplified_expression",
+    [
+        (FunctionCall("add", (1, 2.5)), 3.5),
+        (FunctionCall("div", (FunctionCall("sub", (7, 1)), 4)), 1.5),
+        (FunctionCall("pow", (2, FunctionCall("mul", (3, 1)))), 8),
+        (FunctionCall("add", (0, X)), X),
+        (FunctionCall("mul", (1, X)), X),
+        (FunctionCall("mul", (2, X, 0.5)), X),
+        (
+            FunctionCall("add", (X, FunctionCall("add", (Y, 2)), 3)),
+            FunctionCall("add", (5, X, Y)),
+        ),
+        (
+            FunctionCall("mul", (2, FunctionCall("mul", (X, 3)))),
+            FunctionCall("mul", (6, X)),
+        ),
+        (
+            FunctionCall(
+                "add", (FunctionCall("mul", (2, X)), FunctionCall("mul", (3, X)))
+            ),
+            FunctionCall("mul", (5, X)),
+        ),
+        (
+            FunctionCall("add", (X, FunctionCall("mul", (-1, X)), Y)),
+            Y,
+        ),
+        (
+            FunctionCall("cos", (FunctionCall("add", (X, X)),)),
+            FunctionCall("cos", (FunctionCall("mul", (2, X)),)),
+        ),
+        (FunctionCall("div", (X, 0)), FunctionCall("div", (X, 0))),
+        (FunctionCall("div", (1, 0)), FunctionCall("div", (1, 0))),
+        (FunctionCall("cos", (0,)), FunctionCall("cos", (0,))),
+    ],
+)
+def test_simplifying_expression_gives_expected_result(
+    expression, expected_simplified_expression
+):
+    assert simplify(expression) == expected_simplified_expression
+
+
+def test_simplifying_expressions_differing_in_number_types_keeps_their_types():
+    float_exponent = simplify(FunctionCall("pow", (X, 2.0)))
+    int_exponent = simplify(FunctionCall("pow", (X, 2)))
+
+    assert type(float_exponent.args[1]) is float
+    assert type(int_exponent.args[1]) is int
+
+
+@pytest.mark.parametrize(
+    "binary_operator, args",
+    [
+        (operator.add, (1, 2, 3)),
+        (operator.add, (0.1, 0.2, 0.3, -0.6)),
+        (operator.add, (1e16, 1.0, -1e16)),
+        (operator.add, (-0.0, -0.0)),
+        (operator.add, ((1,), (2, 3))),
+        (operator.mul, (2, 3.5, 1j)),
+        (operator.sub, (10, 3, 2)),
+    ],
+)
+def test_reduction_folds_arguments_from_left_to_right(binary_operator, args):
+    expected_result = functools.reduce(binary_operator, args)
+
+    result = reduction(binary_operator)(*args)
+
+    assert result == expected_result
+    assert type(result) is type(expected_result)
+
+
+def test_names_of_expression_nodes_are_interned():
+    name = "".join(["co", "s"])
+
+    assert Symbol(name).name is sys.intern("cos")
+    assert FunctionCall(name, (1,)).name is sys.intern("cos")
+
+
+def test_function_call_args_are_stored_as_tuple():
+    function_call = FunctionCall("add", [1, Symbol("x")])
+
+    assert function_call.args == (1, Symbol("x"))
+    assert function_call == FunctionCall("add", (1, Symbol("x")))
+    assert hash(function_call) == hash(FunctionCall("add", (1, Symbol("x"))))
+
+
+@pytest.mark.parametrize(
+    "expression, values, expected_result",
+    [
+        (X, {"x": 2.0}, 2.0),
+        (X, {"y": 2.0}, X),
+        (FunctionCall("add", (X, Y)), {"x": 1, "y": 2}, 3),
+        (
+            FunctionCall("add", (FunctionCall("mul", (2, X)), Y)),
+            {"x": 1.5},
+            FunctionCall("add", (3.0, Y)),
+        ),
+        (
+            FunctionCall("cos", (FunctionCall("mul", (X, Y)),)),
+            {"x": 0.5},
+            FunctionCall("cos", (FunctionCall("mul", (0.5, Y)),)),
+        ),
+    ],
+)
+def test_substituting_values_for_symbols_gives_expected_expression(
+    expression, values, expected_result
+):
+    assert substitute(expression, values) == expected_result
@@ -28,6 +28,11 @@ def test_symbols_are_converted_to_instance_of_symbol_class(
     assert expression_from_sympy(sympy_symbol) == expected_symbol
 
 
+def test_dummy_symbols_are_converted_to_symbols_named_as_printed_by_sympy():
+    dummy = sympy.Dummy("x")
+    assert expression_from_sympy(dummy) == Symbol(str(dummy))
+
+
 @pytest.mark.parametrize(
     "sympy_number, expected_number, expected_class",
     [
@@ -231,7 +236,10 @@ def test_sympy_power_with_negative_one_exponent_gets_converted_to_division(
 @pytest.mark.parametrize(
     "sympy_function_call, expected_function_call",
     [
-        (sympy.cos(2), FunctionCall("cos", (2,))),
+        (
+            sympy.cos(2 * sympy.Symbol("x")),
+            FunctionCall("cos", (FunctionCall("mul", (2, Symbol("x"))),)),
+        ),
         (sympy.sin(sympy.Symbol("theta")), FunctionCall("sin", (Symbol("theta"),))),
         (sympy.exp(sympy.Symbol("x")), FunctionCall("exp", (Symbol("x"),))),
     ],
@@ -240,3 +248,37 @@ def test_sympy_fn_calls_are_converted_to_fn_call_object_with_appropriate_fn_name
     sympy_function_call, expected_function_call
 ):
     assert expression_from_sympy(sympy_function_call) == expected_function_call
+
+
+@pytest.mark.parametrize(
+    "sympy_function_call, expected_number",
+    [
+        (sympy.cos(2), -0.4161468365471424),
+        (sympy.exp(sympy.Rational(1, 2)), 1.6487212707001282),
+        (sympy.exp(sympy.I), 0.5403023058681398 + 0.8414709848078965j),
+    ],
+)
+def test_sympy_fn_calls_with_constant_args_are_converted_to_native_numbers(
+    sympy_function_call, expected_number
+):
+    native_number = expression_from_sympy(sympy_function_call)
+    assert isinstance(native_number, type(expected_number))
+    assert native_number == pytest.approx(expected_number)
+
+
+def test_sympy_fn_calls_with_constant_args_overflowing_floats_are_not_evaluated():
+    assert expression_from_sympy(sympy.exp(1000)) == FunctionCall("exp", (1000,))
+
+
+def test_repeated_subexpressions_are_translated_into_the_same_object():
+    theta = sympy.Symbol("theta")
+    expression = sympy.Add(
+        sympy.cos(theta),
+        sympy.Mul(sympy.sin(theta), sympy.cos(theta), evaluate=False),
+        evaluate=False,
+    )
+
+    translated = expression_from_sympy(expression)
+
+    assert translated.args[0] is translated.args[1].args[1]
+    assert expression_from_sympy(expression) is translated
@@ -1,7 +1,13 @@
 """Test cases for symbolic_expressions module."""
+import numpy as np
 import pytest
 import sympy
 from pyquil import quil, quilatom
+from zquantum.core.wip.circuits.symbolic.expressions import (
+    ExpressionDialect,
+    FunctionCall,
+    Symbol,
+)
 from zquantum.core.wip.circuits.symbolic.pyquil_expressions import (
     QUIL_DIALECT,
     expression_from_pyquil,
@@ -10,7 +16,12 @@ from zquantum.core.wip.circuits.symbolic.sympy_expressions import (
     SYMPY_DIALECT,
     expression_from_sympy,
 )
-from zquantum.core.wip.circuits.symbolic.translations import translate_expression
+from zquantum.core.wip.circuits.symbolic.translations import (
+    compile_expression,
+    compile_to_python,
+    translate_expression,
+    translate_with_cse,
+)
 
 
 @pytest.mark.parametrize(
@@ -137,3 +148,183 @@ def test_translating_tree_from_quil_to_sympy_gives_expected_result(
 ):
     expression = expression_from_pyquil(quil_expression)
     assert translate_expression(expression, SYMPY_DIALECT) - sympy_expression == 0
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        FunctionCall("erf", (Symbol("x"),)),
+        FunctionCall("add", (1, FunctionCall("cos", (FunctionCall("erf", (2,)),)))),
+    ],
+)
+def test_translating_tree_with_unknown_function_raises_value_error(expression):
+    with pytest.raises(ValueError):
+        translate_expression(expression, QUIL_DIALECT)
+
+
+@pytest.mark.parametrize(
+    "sympy_expression",
+    [
+        sympy.Symbol("x"),
+        sympy.cos(2 * sympy.Symbol("x")),
+        sympy.Symbol("x") / sympy.Symbol("y") - 1,
+        sympy.exp(sympy.Symbol("x") ** 2 * sympy.Symbol("y")),
+        sympy.sqrt(sympy.Symbol("y")) + sympy.tan(sympy.Symbol("x")),
+    ],
+)
+@pytest.mark.parametrize("values", [(0.5, 2.0), (-1.25, 0.1), (3.0, 4.0)])
+def test_compiled_expression_evaluates_to_the_same_value_as_substituted_expression(
+    sympy_expression, values
+):
+    x, y = sympy.symbols("x, y")
+    compiled = compile_expression(
+        expression_from_sympy(sympy_expression),
+        (Symbol("x"), Symbol("y")),
+        SYMPY_DIALECT,
+    )
+
+    assert float(compiled(values)) == pytest.approx(
+        float(sympy_expression.subs({x: values[0], y: values[1]}))
+    )
+
+
+def test_symbols_not_compiled_as_parameters_are_translated_by_dialect():
+    compiled = compile_expression(
+        expression_from_sympy(sympy.Symbol("x") * sympy.Symbol("theta")),
+        (Symbol("x"),),
+        SYMPY_DIALECT,
+    )
+
+    assert compiled((2,)) == 2 * sympy.Symbol("theta")
+
+
+def test_compiling_tree_with_unknown_function_raises_value_error():
+    with pytest.raises(ValueError):
+        compile_expression(
+            FunctionCall("erf", (Symbol("x"),)), (Symbol("x"),), QUIL_DIALECT
+        )
+
+
+@pytest.mark.parametrize(
+    "sympy_expression",
+    [
+        sympy.cos(sympy.Symbol("theta")) * sympy.cos(sympy.Symbol("theta") + 1),
+        sympy.exp(sympy.Symbol("x") - sympy.Symbol("y")),
+        sympy.sqrt(sympy.Symbol("x")) ** sympy.sqrt(sympy.Symbol("x")),
+    ],
+)
+def test_translating_with_cse_gives_the_same_result_as_plain_translation(
+    sympy_expression,
+):
+    expression = expression_from_sympy(sympy_expression)
+
+    assert translate_with_cse(expression, QUIL_DIALECT) == translate_expression(
+        expression, QUIL_DIALECT
+    )
+
+
+def test_translating_with_cse_translates_each_distinct_subtree_once():
+    calls = []
+    dialect = ExpressionDialect(
+        symbol_factory=lambda symbol: symbol.name,
+        number_factory=lambda number: number,
+        known_functions={
+            "add": lambda *args: ("add", *args),
+            "cos": lambda arg: calls.append(arg) or ("cos", arg),
+        },
+    )
+    cos_theta = FunctionCall("cos", (Symbol("theta"),))
+    expression = FunctionCall(
+        "add", (cos_theta, FunctionCall("cos", (Symbol("theta"),)))
+    )
+
+    result = translate_with_cse(expression, dialect)
+
+    assert result == ("add", ("cos", "theta"), ("cos", "theta"))
+    assert result[1] is result[2]
+    assert calls == ["theta"]
+
+
+@pytest.mark.parametrize(
+    "expression, sympy_expression",
+    [
+        (
+            FunctionCall("add", (Symbol("x"), Symbol("y"), 2)),
+            sympy.Symbol("x") + sympy.Symbol("y") + 2,
+        ),
+        (
+            FunctionCall("mul", (-1.5, Symbol("x"), Symbol("y"))),
+            -1.5 * sympy.Symbol("x") * sympy.Symbol("y"),
+        ),
+    ],
+)
+def test_translating_n_ary_calls_to_sympy_gives_expected_result(
+    expression, sympy_expression
+):
+    assert translate_expression(expression, SYMPY_DIALECT) == sympy_expression
+
+
+@pytest.mark.parametrize(
+    "sympy_expression",
+    [
+        sympy.Symbol("x"),
+        sympy.cos(2 * sympy.Symbol("x")),
+        sympy.Symbol("x") / sympy.Symbol("y") - 1,
+        sympy.exp(sympy.Symbol("x") ** 2 * sympy.Symbol("y")),
+        sympy.sqrt(sympy.Symbol("y")) + sympy.tan(sympy.Symbol("x")),
+    ],
+)
+@pytest.mark.parametrize("values", [(0.5, 2.0), (-1.25, 0.1), (3.0, 4.0)])
+def test_expression_compiled_to_python_evaluates_to_the_same_value_as_substituted_one(
+    sympy_expression, values
+):
+    x, y = sympy.symbols("x, y")
+    compiled = compile_to_python(
+        expression_from_sympy(sympy_expression), (Symbol("x"), Symbol("y"))
+    )
+
+    assert compiled(values) == pytest.approx(
+        float(sympy_expression.subs({x: values[0], y: values[1]}))
+    )
+
+
+def test_expression_compiled_to_python_can_be_evaluated_for_arrays_of_values():
+    expression = FunctionCall(
+        "mul", (FunctionCall("cos", (Symbol("x"),)), Symbol("y"), 2)
+    )
+    xs = np.linspace(0, np.pi, 5)
+    ys = np.linspace(-1, 1, 5)
+
+    compiled = compile_to_python(expression, (Symbol("x"), Symbol("y")))
+
+    np.testing.assert_allclose(compiled((xs, ys)), np.cos(xs) * ys * 2)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        FunctionCall("erf", (Symbol("x"),)),
+        FunctionCall("add", (Symbol("y"), 1)),
+        FunctionCall("sub", (Symbol("x"),)),
+        FunctionCall("pow", (Symbol("x"), 2, 3)),
+        FunctionCall("cos", (Symbol("x"), Symbol("x"))),
+        FunctionCall("add", ()),
+    ],
+)
+def test_compiling_to_python_unknown_function_or_symbol_raises_value_error(
+    expression,
+):
+    with pytest.raises(ValueError):
+        compile_to_python(expression, (Symbol("x"),))
+
+
+def test_expressions_differing_in_number_types_are_compiled_to_python_separately():
+    symbols = (Symbol("x"),)
+    int_exponent = compile_to_python(FunctionCall("pow", (Symbol("x"), -1)), symbols)
+
+    float_exponent = compile_to_python(
+        FunctionCall("pow", (Symbol("x"), -1.0)), symbols
+    )
+
+    assert float_exponent is not int_exponent
+    np.testing.assert_allclose(float_exponent((np.array([1, 2, 4]),)), [1, 0.5, 0.25])